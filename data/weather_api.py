@@ -11,7 +11,9 @@ from src.constants import (
     OPENWEATHER_BASE_URL,
     OPENWEATHER_ICON_URL,
     OPENWEATHER_GEO_URL,
+    SEVERE_WEATHER_KEYWORDS,
     APIConfig,
+    is_severe_weather,
 )
 
 # Initialize logger for this module
@@ -348,16 +350,12 @@ class WeatherAPI:
         
         logger.debug(f"Checking severe weather conditions: {description}, wind: {wind_speed}")
         
-        # Check for severe weather keywords
-        severe_keywords = [
-            "storm", "thunderstorm", "hail", "tornado", "hurricane", 
-            "blizzard", "extreme", "severe", "warning", "advisory"
-        ]
-        
-        for keyword in severe_keywords:
-            if keyword in description:
-                severe_conditions.append(keyword.title())
-                logger.info(f"Severe weather detected: {keyword.title()}")
+        # Check for severe weather keywords (single regex pass rules out calm weather)
+        if is_severe_weather(description):
+            for keyword in SEVERE_WEATHER_KEYWORDS:
+                if keyword in description:
+                    severe_conditions.append(keyword.title())
+                    logger.info(f"Severe weather detected: {keyword.title()}")
         
         # Check wind speed (for imperial units - mph)
         if weather_data.get("units") == "imperial" and wind_speed > 25:
@@ -8,7 +8,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import sys
 import os
-from theme_config import GlassmorphicTheme, CobraTheme
+from theme_config import THEME, CobraTheme
 
 # Import professional infrastructure
 from src.logger import setup_logging, get_logger
@@ -71,7 +71,7 @@ class GlassmorphicWindow:
 
     def __init__(self, theme=None):
         logger.info(f"Initializing {APP_NAME} v{APP_VERSION}")
-        self.theme = theme or GlassmorphicTheme()
+        self.theme = theme or THEME
         self.root = tk.Tk()
 
         # Load configuration
@@ -122,13 +122,12 @@ class GlassmorphicWindow:
     def setup_window(self):
         """Configure the main window with transparent background"""
         self.root.title(f"{APP_NAME} v{APP_VERSION}")
-        self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         self.root.minsize(WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT)
         self.root.configure(bg=self.theme.WINDOW_BG)
 
         logger.debug(f"Window configured: {WINDOW_WIDTH}x{WINDOW_HEIGHT}")
 
-        # Center the window on screen
+        # Size and center the window on screen in a single geometry call
         self.center_window()
 
         # Make window semi-transparent (Windows specific)
@@ -140,13 +139,10 @@ class GlassmorphicWindow:
         # Set minimum size
         self.root.minsize(900, 600)
 
-    def center_window(self):
-        """Center the window on the screen"""
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+    def center_window(self, width=WINDOW_WIDTH, height=WINDOW_HEIGHT):
+        """Size the window and center it on the screen"""
+        x = (self.root.winfo_screenwidth() - width) // 2
+        y = (self.root.winfo_screenheight() - height) // 2
         self.root.geometry(f"{width}x{height}+{x}+{y}")
 
     def create_glassmorphic_frame(self):
@@ -345,9 +341,13 @@ class GlassmorphicWindow:
 
         # Create all panels
         if WeatherDisplayPanel is not None:
-            self.weather_panel = WeatherDisplayPanel(self.panels_container, self.theme)
+            self.weather_panel = WeatherDisplayPanel(
+                self.panels_container, self.theme, on_fetch=self.fetch_weather_data
+            )
         if CobraIntelPanel is not None:
-            self.cobra_panel = CobraIntelPanel(self.panels_container, self.theme)
+            self.cobra_panel = CobraIntelPanel(
+                self.panels_container, self.theme, on_search=self.search_character_data
+            )
         if InteractiveFeaturesPanel is not None:
             self.interactive_panel = InteractiveFeaturesPanel(
                 self.panels_container, self.theme
@@ -355,12 +355,6 @@ class GlassmorphicWindow:
         if SmartAIPanel is not None:
             self.smart_panel = SmartAIPanel(self.panels_container, self.theme)
 
-        # Connect button events
-        if hasattr(self, "weather_panel"):
-            self.weather_panel.fetch_button.config(command=self.fetch_weather_data)
-        if hasattr(self, "cobra_panel"):
-            self.cobra_panel.search_button.config(command=self.search_character_data)
-
         # Show default tab
         self.show_main_tab(0)
 
@@ -515,8 +509,11 @@ class GlassmorphicWindow:
 
         try:
             # Show loading
-            self.weather_panel.temp_label.config(text="Loading weather data...")
-            self.root.update()
+            self.weather_panel.set_status(
+                self.weather_panel.temp_label, "Loading weather data..."
+            )
+            # Paint the status without re-entering the event loop mid-callback
+            self.root.update_idletasks()
 
             # Fetch weather data
             weather_data = self.weather_api.get_current_weather(city)
@@ -602,8 +599,11 @@ class GlassmorphicWindow:
 
         try:
             # Show loading
-            self.cobra_panel.char_name_label.config(text="Searching Cobra database...")
-            self.root.update()
+            self.cobra_panel.set_status(
+                self.cobra_panel.char_name_label, "Searching Cobra database..."
+            )
+            # Paint the status without re-entering the event loop mid-callback
+            self.root.update_idletasks()
 
             # Search character data
             char_data = self.gijoe_api.get_character_data(character_name)
@@ -628,6 +628,11 @@ class GlassmorphicWindow:
         self.root.mainloop()
 
 
+# Opt-in startup profiling; inspect the output with snakeviz or pstats
+PROFILE_FLAG = "--profile"
+PROFILE_OUTPUT = "ui_startup.prof"
+
+
 def main():
     """Main function to run the application"""
     try:
@@ -635,9 +640,25 @@ def main():
         logger.info(f"{APP_NAME} v{APP_VERSION}")
         logger.info("=" * 60)
 
+        # Optionally profile the UI bring-up (python main.py --profile)
+        profiler = None
+        if PROFILE_FLAG in sys.argv:
+            import cProfile
+
+            profiler = cProfile.Profile()
+            profiler.enable()
+
         # You can switch themes here
         # app = GlassmorphicWindow(CobraTheme())  # For COBRA red theme
         app = GlassmorphicWindow()  # Default blue theme
+
+        if profiler is not None:
+            # Lazy panels build on first map, so include the first paint
+            app.root.update()
+            profiler.disable()
+            profiler.dump_stats(PROFILE_OUTPUT)
+            logger.info(f"Startup profile written to {PROFILE_OUTPUT}")
+
         app.run()
     except Exception as e:
         logger.critical(f"Error starting application: {e}", exc_info=True)
@@ -7,26 +7,70 @@ Applies the G.I. Joe schema and populates the database with sample data
 import sqlite3
 import json
 import os
+from contextlib import contextmanager
 from datetime import datetime
 
 
+def encode_raw_data(item: dict) -> str:
+    """Serialize a record to compact JSON text for the raw_data column"""
+    return json.dumps(item, separators=(",", ":"))
+
+
 class GIJoeDBPopulator:
     """Populate Weather Dominator database with G.I. Joe data"""
 
     def __init__(self, db_path: str = "weather_dominator.db"):
         self.db_path = db_path
+        # Shared connection while a multi-step load runs in one transaction
+        self._conn = None
         print(f"🗃️ Using database: {self.db_path}")
 
+    @contextmanager
+    def _connection(self):
+        """Yield the shared load connection, or a short-lived one that commits on exit"""
+        if self._conn is not None:
+            yield self._conn
+            return
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        """Run every step inside the block on one connection and one transaction"""
+        self._conn = sqlite3.connect(self.db_path)
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            yield self._conn
+            self._conn.commit()
+        except BaseException:
+            self._conn.rollback()
+            raise
+        finally:
+            self._conn.close()
+            self._conn = None
+
+    def _reraise_in_transaction(self):
+        """Re-raise the active error when running inside _transaction
+
+        Standalone steps report and swallow errors; inside a full load the
+        error must reach _transaction so everything is rolled back.
+        """
+        if self._conn is not None:
+            raise
+
     def apply_schema(self):
         """Apply the G.I. Joe database schema"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-
+            with self._connection() as conn:
                 print("📋 Creating G.I. Joe tables...")
 
                 # G.I. Joe Characters table
-                cursor.execute(
+                conn.execute(
                     """
                     CREATE TABLE IF NOT EXISTS gijoe_characters (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -50,7 +94,7 @@ class GIJoeDBPopulator:
                 )
 
                 # G.I. Joe Vehicles table
-                cursor.execute(
+                conn.execute(
                     """
                     CREATE TABLE IF NOT EXISTS gijoe_vehicles (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -75,7 +119,7 @@ class GIJoeDBPopulator:
                 )
 
                 # G.I. Joe Weapons table
-                cursor.execute(
+                conn.execute(
                     """
                     CREATE TABLE IF NOT EXISTS gijoe_weapons (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -95,7 +139,7 @@ class GIJoeDBPopulator:
                 )
 
                 # G.I. Joe Locations table
-                cursor.execute(
+                conn.execute(
                     """
                     CREATE TABLE IF NOT EXISTS gijoe_locations (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -116,7 +160,7 @@ class GIJoeDBPopulator:
                 )
 
                 # Character-Vehicle relationships
-                cursor.execute(
+                conn.execute(
                     """
                     CREATE TABLE IF NOT EXISTS character_vehicle_relations (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -131,7 +175,7 @@ class GIJoeDBPopulator:
                 )
 
                 # Character-Weapon relationships
-                cursor.execute(
+                conn.execute(
                     """
                     CREATE TABLE IF NOT EXISTS character_weapon_relations (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -157,13 +201,13 @@ class GIJoeDBPopulator:
                 ]
 
                 for index_sql in indexes:
-                    cursor.execute(index_sql)
+                    conn.execute(index_sql)
 
-                conn.commit()
                 print("✅ G.I. Joe schema applied successfully!")
 
         except sqlite3.Error as e:
             print(f"❌ Error applying schema: {e}")
+            self._reraise_in_transaction()
 
     def populate_characters(self):
         """Populate characters table with comprehensive G.I. Joe character data"""
@@ -829,9 +873,7 @@ class GIJoeDBPopulator:
     def _insert_data(self, table_name: str, data_list: list, data_type: str):
         """Generic method to insert data into tables"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-
+            with self._connection() as conn:
                 inserted_count = 0
                 for item in data_list:
                     try:
@@ -841,25 +883,32 @@ class GIJoeDBPopulator:
                         values = [item[col] for col in columns]
 
                         sql = f"INSERT OR REPLACE INTO {table_name} ({', '.join(columns)}, raw_data) VALUES ({placeholders}, ?)"
-                        values.append(json.dumps(item))
+                        values.append(encode_raw_data(item))
 
-                        cursor.execute(sql, values)
+                        conn.execute(sql, values)
                         inserted_count += 1
 
                     except sqlite3.Error as e:
+                        # A shared load fails as a whole; the outer handler reports it
+                        self._reraise_in_transaction()
                         print(f"❌ Error inserting {item.get('name', 'unknown')}: {e}")
 
-                conn.commit()
                 print(f"✅ Inserted {inserted_count} {data_type}")
 
         except sqlite3.Error as e:
             print(f"❌ Database error inserting {data_type}: {e}")
+            self._reraise_in_transaction()
 
     def create_relationships(self):
         """Create character-vehicle and character-weapon relationships"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
+            with self._connection() as conn:
+                # Resolve names to ids once instead of per-row subqueries
+                character_ids = dict(
+                    conn.execute("SELECT name, id FROM gijoe_characters")
+                )
+                vehicle_ids = dict(conn.execute("SELECT name, id FROM gijoe_vehicles"))
+                weapon_ids = dict(conn.execute("SELECT name, id FROM gijoe_weapons"))
 
                 # Character-Vehicle relationships
                 relationships = [
@@ -868,19 +917,16 @@ class GIJoeDBPopulator:
                     ("Scarlett", "VAMP", "Secondary Driver"),
                 ]
 
-                for char_name, vehicle_name, relationship in relationships:
-                    cursor.execute(
-                        """
-                        INSERT OR REPLACE INTO character_vehicle_relations 
-                        (character_id, vehicle_id, relationship_type)
-                        VALUES (
-                            (SELECT id FROM gijoe_characters WHERE name = ?),
-                            (SELECT id FROM gijoe_vehicles WHERE name = ?),
-                            ?
-                        )
-                    """,
-                        (char_name, vehicle_name, relationship),
-                    )
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO character_vehicle_relations 
+                    (character_id, vehicle_id, relationship_type)
+                    VALUES (?, ?, ?)
+                """,
+                    self._resolve_relationships(
+                        relationships, character_ids, vehicle_ids
+                    ),
+                )
 
                 # Character-Weapon relationships
                 weapon_relationships = [
@@ -890,64 +936,70 @@ class GIJoeDBPopulator:
                     ("Storm Shadow", "Katana", "Primary Weapon"),
                 ]
 
-                for char_name, weapon_name, relationship in weapon_relationships:
-                    cursor.execute(
-                        """
-                        INSERT OR REPLACE INTO character_weapon_relations 
-                        (character_id, weapon_id, relationship_type)
-                        VALUES (
-                            (SELECT id FROM gijoe_characters WHERE name = ?),
-                            (SELECT id FROM gijoe_weapons WHERE name = ?),
-                            ?
-                        )
-                    """,
-                        (char_name, weapon_name, relationship),
-                    )
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO character_weapon_relations 
+                    (character_id, weapon_id, relationship_type)
+                    VALUES (?, ?, ?)
+                """,
+                    self._resolve_relationships(
+                        weapon_relationships, character_ids, weapon_ids
+                    ),
+                )
 
-                conn.commit()
                 print("✅ Created character relationships")
 
         except sqlite3.Error as e:
             print(f"❌ Error creating relationships: {e}")
+            self._reraise_in_transaction()
+
+    def _resolve_relationships(
+        self, relationships: list, character_ids: dict, target_ids: dict
+    ) -> list:
+        """Map (character, target, relationship) names to integer id rows"""
+        rows = []
+        for char_name, target_name, relationship in relationships:
+            char_id = character_ids.get(char_name)
+            target_id = target_ids.get(target_name)
+            if char_id is None or target_id is None:
+                print(f"⚠️ Skipping relationship {char_name} -> {target_name}: not found")
+                continue
+            rows.append((char_id, target_id, relationship))
+        return rows
 
     def get_database_stats(self):
         """Display database statistics"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-
+            with self._connection() as conn:
                 print("\n📊 G.I. Joe Database Statistics:")
 
                 # Characters by faction
-                cursor.execute(
-                    "SELECT faction, COUNT(*) FROM gijoe_characters GROUP BY faction"
-                )
-                char_stats = cursor.fetchall()
                 print("   Characters by Faction:")
-                for faction, count in char_stats:
+                for faction, count in conn.execute(
+                    "SELECT faction, COUNT(*) FROM gijoe_characters GROUP BY faction"
+                ):
                     print(f"     {faction}: {count}")
 
                 # Vehicles by faction
-                cursor.execute(
-                    "SELECT faction, COUNT(*) FROM gijoe_vehicles GROUP BY faction"
-                )
-                vehicle_stats = cursor.fetchall()
                 print("   Vehicles by Faction:")
-                for faction, count in vehicle_stats:
+                for faction, count in conn.execute(
+                    "SELECT faction, COUNT(*) FROM gijoe_vehicles GROUP BY faction"
+                ):
                     print(f"     {faction}: {count}")
 
                 # Total counts
-                cursor.execute("SELECT COUNT(*) FROM gijoe_characters")
-                char_total = cursor.fetchone()[0]
-
-                cursor.execute("SELECT COUNT(*) FROM gijoe_vehicles")
-                vehicle_total = cursor.fetchone()[0]
-
-                cursor.execute("SELECT COUNT(*) FROM gijoe_weapons")
-                weapon_total = cursor.fetchone()[0]
-
-                cursor.execute("SELECT COUNT(*) FROM gijoe_locations")
-                location_total = cursor.fetchone()[0]
+                char_total = conn.execute(
+                    "SELECT COUNT(*) FROM gijoe_characters"
+                ).fetchone()[0]
+                vehicle_total = conn.execute(
+                    "SELECT COUNT(*) FROM gijoe_vehicles"
+                ).fetchone()[0]
+                weapon_total = conn.execute(
+                    "SELECT COUNT(*) FROM gijoe_weapons"
+                ).fetchone()[0]
+                location_total = conn.execute(
+                    "SELECT COUNT(*) FROM gijoe_locations"
+                ).fetchone()[0]
 
                 print(f"\n   Total Records:")
                 print(f"     Characters: {char_total}")
@@ -958,16 +1010,54 @@ class GIJoeDBPopulator:
         except sqlite3.Error as e:
             print(f"❌ Error getting statistics: {e}")
 
+    def _drop_secondary_indexes(self, conn) -> list:
+        """Drop user-created G.I. Joe indexes before a bulk load and return their DDL
+
+        Indexes backing UNIQUE constraints have no stored SQL and are kept.
+        """
+        index_rows = conn.execute(
+            """
+            SELECT name, sql FROM sqlite_master
+            WHERE type = 'index' AND sql IS NOT NULL AND tbl_name LIKE 'gijoe_%'
+            """
+        ).fetchall()
+
+        for index_name, _ in index_rows:
+            conn.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+
+        return [index_sql for _, index_sql in index_rows]
+
+    def _restore_indexes(self, conn, index_ddl: list):
+        """Recreate indexes dropped for a bulk load and refresh planner statistics"""
+        print("🔍 Rebuilding database indexes...")
+        for index_sql in index_ddl:
+            conn.execute(index_sql)
+
+        for table_name in (
+            "gijoe_characters",
+            "gijoe_vehicles",
+            "gijoe_weapons",
+            "gijoe_locations",
+        ):
+            conn.execute(f"ANALYZE {table_name}")
+
     def run_full_population(self):
-        """Run complete database population"""
+        """Run complete database population in a single transaction"""
         print("🚀 Starting G.I. Joe database population...")
 
-        self.apply_schema()
-        self.populate_characters()
-        self.populate_vehicles()
-        self.populate_weapons()
-        self.populate_locations()
-        self.create_relationships()
+        try:
+            with self._transaction() as conn:
+                self.apply_schema()
+                index_ddl = self._drop_secondary_indexes(conn)
+                self.populate_characters()
+                self.populate_vehicles()
+                self.populate_weapons()
+                self.populate_locations()
+                self.create_relationships()
+                self._restore_indexes(conn, index_ddl)
+        except sqlite3.Error as e:
+            print(f"❌ Database population failed, changes rolled back: {e}")
+            return
 
         print("\n✅ G.I. Joe database population complete!")
         self.get_database_stats()
@@ -5,7 +5,7 @@ This file allows the package to be installed via pip and sets up
 entry points, dependencies, and package metadata.
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 from pathlib import Path
 
 # Read the README file
@@ -46,7 +46,9 @@ setup(
         "Documentation": "https://github.com/StrayDogSyndicate/Weather_Dominator/blob/main/README.md",
         "Source Code": "https://github.com/StrayDogSyndicate/Weather_Dominator",
     },
-    packages=find_packages(exclude=["tests", "tests.*", "docs"]),
+    # Explicit package list (avoids a find_packages() tree walk on every build).
+    # Keep in sync when adding a new top-level package.
+    packages=["data", "db", "ml", "src", "ui", "utils"],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: End Users/Desktop",
@@ -72,6 +74,8 @@ setup(
             "pytest>=7.0.0",
             "pytest-cov>=3.0.0",
         ],
+        # Faster config load/save; src.config_manager falls back to stdlib json
+        "fast": ["orjson>=3.8.0"],
     },
     entry_points={
         "console_scripts": [
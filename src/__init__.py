@@ -9,14 +9,38 @@ __version__ = "2.0.0"
 __author__ = "Stray Dog Syndicate"
 __email__ = "support@straydogsyndicate.com"
 
-from src.config_manager import ConfigManager, get_config_manager
-from src.exceptions import (
-    APIKeyMissingError,
-    ConfigurationError,
-    DatabaseError,
-    WeatherDominatorError,
-)
-from src.logger import get_logger, setup_logging
+import importlib
+from typing import Any
+
+# Public names are resolved lazily (PEP 562) so that importing a single
+# submodule such as ``src.constants`` does not pull in the whole package.
+_LAZY_IMPORTS = {
+    "ConfigManager": "src.config_manager",
+    "get_config_manager": "src.config_manager",
+    "setup_logging": "src.logger",
+    "get_logger": "src.logger",
+    "WeatherDominatorError": "src.exceptions",
+    "APIKeyMissingError": "src.exceptions",
+    "ConfigurationError": "src.exceptions",
+    "DatabaseError": "src.exceptions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public package attributes on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily imported names in ``dir(src)``."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "ConfigManager",
@@ -5,17 +5,161 @@ This module provides centralized configuration management with support for
 JSON config files, environment variables, and default values.
 """
 
+import atexit
+import functools
 import json
 import logging
+import mmap
+import operator
 import os
-from dataclasses import asdict, dataclass, field
+import stat
+import tempfile
+import threading
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+from src.constants import DATACLASS_OPTIONS
+
+# Prefer orjson for config load/save, but fall back to the stdlib encoder
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Top-level configuration sections, in the order they are written to disk
+CONFIG_SECTIONS = ("api_keys", "preferences", "cache", "database")
+
+# Environment variable overrides: (variable, section, field, log label)
+_ENV_OVERRIDES = (
+    ("OPENWEATHER_API_KEY", "api_keys", "openweather", "OpenWeather API key"),
+    ("FANDOM_API_KEY", "api_keys", "fandom", "Fandom API key"),
+    ("TEMP_UNIT", "preferences", "temperature_unit", None),
+    ("WIND_UNIT", "preferences", "wind_unit", None),
+    ("APP_THEME", "preferences", "theme", None),
+    ("DATABASE_PATH", "database", "path", None),
+)
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Config files at least this large are parsed straight from a memory map
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _load_json_file(path: Path) -> Any:
+    """
+    Read and parse a JSON file in binary mode.
+
+    Small files are read in one call; large ones are memory-mapped and, with
+    orjson, parsed in place without an intermediate copy.
+
+    Args:
+        path: JSON file path
+
+    Returns:
+        Parsed JSON data
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            return _json_loads(f.read())
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if ORJSON_AVAILABLE:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+            return json.loads(mm[:])
+
+
+# Parsed config files: absolute path -> ((st_mtime_ns, st_size), parsed data).
+# Parsed data is treated as read-only; AppConfig builds new sections from it.
+_PARSE_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _load_json_file_cached(path: Path, file_stat: os.stat_result) -> Any:
+    """
+    Parse a config file, reusing the previous result if it is unchanged on disk.
+
+    Args:
+        path: JSON file path
+        file_stat: Current stat result for path
+
+    Returns:
+        Parsed JSON data
+    """
+    key = os.path.abspath(path)
+    signature = (file_stat.st_mtime_ns, file_stat.st_size)
+
+    cached = _PARSE_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    data = _load_json_file(path)
+    _PARSE_CACHE[key] = (signature, data)
+    return data
+
+
+def _remember_parsed(path: Path, data: Any):
+    """Record data just written to path so the next load skips parsing it."""
+    try:
+        file_stat = os.stat(path)
+    except OSError:
+        return
+    _PARSE_CACHE[os.path.abspath(path)] = (
+        (file_stat.st_mtime_ns, file_stat.st_size),
+        data,
+    )
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON bytes with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
 
-@dataclass
+@functools.lru_cache(maxsize=4)
+def _resolve_default_config_path(cwd: str, home: str) -> Path:
+    """
+    Find the first existing default configuration file.
+
+    Cached per (cwd, home) so repeated ConfigManager construction does not
+    re-probe the filesystem; see ConfigManager.invalidate_path_cache().
+
+    Args:
+        cwd: Current working directory
+        home: User home directory
+
+    Returns:
+        Path of the first existing candidate, or the first candidate
+    """
+    possible_paths = [
+        Path("config/config.json"),
+        Path("config.json"),
+        Path(home) / ".weather_dominator" / "config.json",
+    ]
+
+    for path in possible_paths:
+        try:
+            os.stat(Path(cwd) / path)
+        except OSError:
+            continue
+        return path
+
+    # Default to first location
+    return possible_paths[0]
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class APIKeys:
     """API key configuration."""
 
@@ -23,7 +167,7 @@ class APIKeys:
     fandom: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Preferences:
     """User preferences configuration."""
 
@@ -33,7 +177,7 @@ class Preferences:
     theme: str = "default"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class CacheSettings:
     """Cache configuration."""
 
@@ -41,7 +185,7 @@ class CacheSettings:
     max_size_mb: int = 50
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class DatabaseSettings:
     """Database configuration."""
 
@@ -49,14 +193,129 @@ class DatabaseSettings:
     cleanup_days: int = 30
 
 
-@dataclass
+# Supported API key services and their attribute getters
+_API_KEY_GETTERS = {
+    "openweather": operator.attrgetter("openweather"),
+    "fandom": operator.attrgetter("fandom"),
+}
+
+
+# Field names per section, used for flat serialization without asdict()
+_SECTION_FIELDS = {
+    "api_keys": tuple(f.name for f in fields(APIKeys)),
+    "preferences": tuple(f.name for f in fields(Preferences)),
+    "cache": tuple(f.name for f in fields(CacheSettings)),
+    "database": tuple(f.name for f in fields(DatabaseSettings)),
+}
+
+
+# Valid preference keys
+_PREFERENCE_KEYS = frozenset(_SECTION_FIELDS["preferences"])
+
+
+def _section_to_dict(section: Any, field_names: Tuple[str, ...]) -> Dict[str, Any]:
+    """Serialize a flat config section (shallow replacement for asdict)."""
+    return {name: getattr(section, name) for name in field_names}
+
+
+class _LazySection:
+    """Descriptor that builds a config section from raw parsed data on first access."""
+
+    def __init__(self, section_type: type):
+        self.section_type = section_type
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, instance: Optional["AppConfig"], owner: Optional[type] = None):
+        if instance is None:
+            return self
+
+        section = instance._sections.get(self.name)
+        if section is None:
+            raw_section = instance._raw.get(self.name, {})
+            try:
+                section = self.section_type(**raw_section)
+            except TypeError as e:
+                logger.warning("Invalid '%s' config section: %s. Using defaults.", self.name, e)
+                section = self.section_type()
+            instance._sections[self.name] = section
+        return section
+
+    def __set__(self, instance: "AppConfig", value: Any):
+        instance._sections[self.name] = value
+
+
 class AppConfig:
-    """Main application configuration."""
+    """
+    Main application configuration.
+
+    Sections given to the constructor are used as-is; the rest are built
+    from the raw parsed file data (see from_dict) the first time they are
+    accessed, so code touching one section does not pay for the others.
+    """
 
-    api_keys: APIKeys = field(default_factory=APIKeys)
-    preferences: Preferences = field(default_factory=Preferences)
-    cache: CacheSettings = field(default_factory=CacheSettings)
-    database: DatabaseSettings = field(default_factory=DatabaseSettings)
+    __slots__ = ("_raw", "_sections")
+
+    api_keys = _LazySection(APIKeys)
+    preferences = _LazySection(Preferences)
+    cache = _LazySection(CacheSettings)
+    database = _LazySection(DatabaseSettings)
+
+    def __init__(
+        self,
+        api_keys: Optional[APIKeys] = None,
+        preferences: Optional[Preferences] = None,
+        cache: Optional[CacheSettings] = None,
+        database: Optional[DatabaseSettings] = None,
+    ):
+        self._raw: Dict[str, Dict[str, Any]] = {}
+        self._sections: Dict[str, Any] = {}
+
+        for name, section in (
+            ("api_keys", api_keys),
+            ("preferences", preferences),
+            ("cache", cache),
+            ("database", database),
+        ):
+            if section is not None:
+                self._sections[name] = section
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AppConfig":
+        """
+        Create a configuration whose sections are parsed lazily from a dict.
+
+        Args:
+            data: Parsed configuration file contents
+
+        Returns:
+            AppConfig object
+
+        Raises:
+            TypeError: If data is not a mapping
+        """
+        if not isinstance(data, dict):
+            raise TypeError(f"Expected a JSON object, got {type(data).__name__}")
+
+        config = cls()
+        config._raw = data
+        return config
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AppConfig):
+            return NotImplemented
+        return all(
+            getattr(self, section) == getattr(other, section)
+            for section in CONFIG_SECTIONS
+        )
+
+    def __repr__(self) -> str:
+        sections = ", ".join(
+            f"{section}={getattr(self, section)!r}" for section in CONFIG_SECTIONS
+        )
+        return f"AppConfig({sections})"
 
 
 class ConfigManager:
@@ -71,17 +330,29 @@ class ConfigManager:
     Attributes:
         config: Current application configuration
         config_path: Path to configuration file
+        autosave_delay: Seconds to coalesce setter writes for, or None to
+            write synchronously on every setter call
     """
 
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(
+        self, config_path: Optional[str] = None, autosave_delay: Optional[float] = None
+    ):
         """
         Initialize configuration manager.
 
         Args:
             config_path: Path to configuration file. If None, uses default location.
+            autosave_delay: If set, setters only mark their section dirty and a
+                single write is scheduled after this many seconds.
         """
         self.config_path = self._resolve_config_path(config_path)
         self.config = self._load_config()
+        self.autosave_delay = autosave_delay
+
+        # Pending delayed write, if any; guarded by _flush_lock
+        self._flush_timer: Optional[threading.Timer] = None
+        self._flush_lock = threading.Lock()
+        self._atexit_registered = False
 
     def _resolve_config_path(self, config_path: Optional[str]) -> Path:
         """
@@ -96,19 +367,12 @@ class ConfigManager:
         if config_path:
             return Path(config_path)
 
-        # Check multiple locations
-        possible_paths = [
-            Path("config/config.json"),
-            Path("config.json"),
-            Path.home() / ".weather_dominator" / "config.json",
-        ]
-
-        for path in possible_paths:
-            if path.exists():
-                return path
+        return _resolve_default_config_path(os.getcwd(), str(Path.home()))
 
-        # Default to first location
-        return possible_paths[0]
+    @classmethod
+    def invalidate_path_cache(cls):
+        """Forget cached default config locations (e.g. after creating a file)."""
+        _resolve_default_config_path.cache_clear()
 
     def _load_config(self) -> AppConfig:
         """
@@ -119,17 +383,22 @@ class ConfigManager:
         """
         config = AppConfig()
 
-        # Load from JSON file if exists
-        if self.config_path.exists():
+        # Load from JSON file if exists (status cached for get_config_summary)
+        try:
+            file_stat: Optional[os.stat_result] = os.stat(self.config_path)
+        except OSError:
+            file_stat = None
+        self._path_exists = file_stat is not None and stat.S_ISREG(file_stat.st_mode)
+
+        if self._path_exists:
             try:
-                with open(self.config_path, "r") as f:
-                    data = json.load(f)
+                data = _load_json_file_cached(self.config_path, file_stat)
                 config = self._dict_to_config(data)
-                logger.info(f"Configuration loaded from {self.config_path}")
+                logger.info("Configuration loaded from %s", self.config_path)
             except Exception as e:
-                logger.warning(f"Failed to load config file: {e}. Using defaults.")
+                logger.warning("Failed to load config file: %s. Using defaults.", e)
         else:
-            logger.info(f"Config file not found at {self.config_path}. Using defaults.")
+            logger.info("Config file not found at %s. Using defaults.", self.config_path)
 
         # Override with environment variables
         config = self._load_from_environment(config)
@@ -140,20 +409,15 @@ class ConfigManager:
         """
         Convert dictionary to AppConfig object.
 
+        Sections are materialized lazily on first access.
+
         Args:
             data: Configuration dictionary
 
         Returns:
             AppConfig object
         """
-        api_keys = APIKeys(**data.get("api_keys", {}))
-        preferences = Preferences(**data.get("preferences", {}))
-        cache = CacheSettings(**data.get("cache", {}))
-        database = DatabaseSettings(**data.get("database", {}))
-
-        return AppConfig(
-            api_keys=api_keys, preferences=preferences, cache=cache, database=database
-        )
+        return AppConfig.from_dict(data)
 
     def _load_from_environment(self, config: AppConfig) -> AppConfig:
         """
@@ -167,28 +431,13 @@ class ConfigManager:
         Returns:
             Updated configuration
         """
-        # API Keys
-        if openweather_key := os.getenv("OPENWEATHER_API_KEY"):
-            config.api_keys.openweather = openweather_key
-            logger.info("OpenWeather API key loaded from environment")
-
-        if fandom_key := os.getenv("FANDOM_API_KEY"):
-            config.api_keys.fandom = fandom_key
-            logger.info("Fandom API key loaded from environment")
-
-        # Preferences
-        if temp_unit := os.getenv("TEMP_UNIT"):
-            config.preferences.temperature_unit = temp_unit
-
-        if wind_unit := os.getenv("WIND_UNIT"):
-            config.preferences.wind_unit = wind_unit
-
-        if theme := os.getenv("APP_THEME"):
-            config.preferences.theme = theme
-
-        # Database
-        if db_path := os.getenv("DATABASE_PATH"):
-            config.database.path = db_path
+        env = os.environ
+        for var, section, field_name, label in _ENV_OVERRIDES:
+            value = env.get(var)
+            if value:
+                setattr(getattr(config, section), field_name, value)
+                if label:
+                    logger.info("%s loaded from environment", label)
 
         return config
 
@@ -196,31 +445,130 @@ class ConfigManager:
         """
         Save current configuration to file.
 
+        Any pending delayed write is cancelled and performed immediately.
+
         Returns:
             True if successful, False otherwise
         """
+        return self._flush()
+
+    def _flush(self) -> bool:
+        """
+        Write the configuration, cancelling any pending delayed write.
+
+        Every section is re-serialized, since ``config`` is public and may
+        have been edited directly since the last write.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            # Nothing is pending any more, so release the exit hook's reference
+            if self._atexit_registered:
+                atexit.unregister(self.flush_pending)
+                self._atexit_registered = False
+
+            try:
+                # Ensure directory exists
+                self.config_path.parent.mkdir(parents=True, exist_ok=True)
+
+                config_dict = {
+                    section: _section_to_dict(
+                        getattr(self.config, section), _SECTION_FIELDS[section]
+                    )
+                    for section in CONFIG_SECTIONS
+                }
+
+                # Write to a sibling temp file and swap it in atomically, so a
+                # crash mid-write leaves either the old or the new file
+                self._write_atomic(_json_dumps(config_dict))
+                self._path_exists = True
+                _remember_parsed(self.config_path, config_dict)
+
+                logger.info("Configuration saved to %s", self.config_path)
+                return True
+
+            except Exception as e:
+                logger.error("Failed to save configuration: %s", e)
+                return False
+
+    def _write_atomic(self, payload: bytes):
+        """
+        Atomically replace the config file with payload.
+
+        Args:
+            payload: Serialized configuration
+        """
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.config_path.parent, prefix=".config-", suffix=".tmp"
+        )
         try:
-            # Ensure directory exists
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            # Keep the permissions of an existing file (mkstemp creates 0600)
+            if self._path_exists:
+                try:
+                    os.chmod(tmp_path, os.stat(self.config_path).st_mode & 0o7777)
+                except OSError:
+                    pass
+            os.replace(tmp_path, self.config_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
 
-            # Convert to dictionary
-            config_dict = {
-                "api_keys": asdict(self.config.api_keys),
-                "preferences": asdict(self.config.preferences),
-                "cache": asdict(self.config.cache),
-                "database": asdict(self.config.database),
-            }
+    def _mark_dirty(self) -> bool:
+        """
+        Persist a configuration change.
 
-            # Write to file
-            with open(self.config_path, "w") as f:
-                json.dump(config_dict, f, indent=2)
+        Writes immediately unless ``autosave_delay`` is set, in which case
+        repeated changes are coalesced into one delayed write. A delayed
+        write still pending at interpreter exit is performed then; the exit
+        hook is registered only while a write is pending.
 
-            logger.info(f"Configuration saved to {self.config_path}")
-            return True
+        Returns:
+            True if the change was saved or scheduled, False otherwise
+        """
+        if self.autosave_delay is None:
+            return self._flush()
+
+        with self._flush_lock:
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.autosave_delay, self._flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+            if not self._atexit_registered:
+                atexit.register(self.flush_pending)
+                self._atexit_registered = True
+        return True
+
+    def flush_pending(self) -> bool:
+        """
+        Perform a pending delayed write now, if there is one.
 
-        except Exception as e:
-            logger.error(f"Failed to save configuration: {e}")
-            return False
+        Returns:
+            True if nothing was pending or the write succeeded
+        """
+        with self._flush_lock:
+            pending = self._flush_timer is not None
+        return self._flush() if pending else True
+
+    def refresh_path_status(self) -> bool:
+        """
+        Re-check whether the config file exists on disk.
+
+        Use after another process creates or removes the file.
+
+        Returns:
+            True if the config file exists
+        """
+        self._path_exists = self.config_path.is_file()
+        return self._path_exists
 
     def get_api_key(self, service: str) -> Optional[str]:
         """
@@ -232,7 +580,8 @@ class ConfigManager:
         Returns:
             API key or None if not configured
         """
-        return getattr(self.config.api_keys, service, None)
+        getter = _API_KEY_GETTERS.get(service)
+        return getter(self.config.api_keys) if getter else None
 
     def set_api_key(self, service: str, key: str) -> bool:
         """
@@ -245,11 +594,15 @@ class ConfigManager:
         Returns:
             True if successful, False otherwise
         """
+        if service not in _API_KEY_GETTERS:
+            logger.error("Failed to set API key: unknown service '%s'", service)
+            return False
+
         try:
             setattr(self.config.api_keys, service, key)
-            return self.save_config()
+            return self._mark_dirty()
         except Exception as e:
-            logger.error(f"Failed to set API key: {e}")
+            logger.error("Failed to set API key: %s", e)
             return False
 
     def get_preference(self, key: str, default: Any = None) -> Any:
@@ -263,7 +616,9 @@ class ConfigManager:
         Returns:
             Preference value or default
         """
-        return getattr(self.config.preferences, key, default)
+        if key not in _PREFERENCE_KEYS:
+            return default
+        return getattr(self.config.preferences, key)
 
     def set_preference(self, key: str, value: Any) -> bool:
         """
@@ -276,11 +631,15 @@ class ConfigManager:
         Returns:
             True if successful, False otherwise
         """
+        if key not in _PREFERENCE_KEYS:
+            logger.error("Failed to set preference: unknown key '%s'", key)
+            return False
+
         try:
             setattr(self.config.preferences, key, value)
-            return self.save_config()
+            return self._mark_dirty()
         except Exception as e:
-            logger.error(f"Failed to set preference: {e}")
+            logger.error("Failed to set preference: %s", e)
             return False
 
     def get_database_path(self) -> str:
@@ -323,12 +682,15 @@ class ConfigManager:
         """
         Get configuration summary for display.
 
+        The file-existence flag is the cached stat result (see
+        refresh_path_status); everything else is read fresh.
+
         Returns:
             Dictionary with configuration summary
         """
         return {
             "config_file": str(self.config_path),
-            "config_exists": self.config_path.exists(),
+            "config_exists": self._path_exists,
             "openweather_configured": self.is_api_configured("openweather"),
             "fandom_configured": self.is_api_configured("fandom"),
             "temperature_unit": self.config.preferences.temperature_unit,
@@ -347,18 +709,22 @@ class ConfigManager:
             self.config = AppConfig()
             return self.save_config()
         except Exception as e:
-            logger.error(f"Failed to reset configuration: {e}")
+            logger.error("Failed to reset configuration: %s", e)
             return False
 
 
 # Singleton instance
 _config_manager: Optional[ConfigManager] = None
+_config_manager_lock = threading.Lock()
 
 
 def get_config_manager(config_path: Optional[str] = None) -> ConfigManager:
     """
     Get singleton configuration manager instance.
 
+    Thread-safe: the instance is created at most once even when several
+    threads ask for it concurrently.
+
     Args:
         config_path: Optional configuration path (only used on first call)
 
@@ -367,8 +733,13 @@ def get_config_manager(config_path: Optional[str] = None) -> ConfigManager:
     """
     global _config_manager
 
-    if _config_manager is None:
-        _config_manager = ConfigManager(config_path)
+    # Fast path without taking the lock
+    if _config_manager is not None:
+        return _config_manager
+
+    with _config_manager_lock:
+        if _config_manager is None:
+            _config_manager = ConfigManager(config_path)
 
     return _config_manager
 
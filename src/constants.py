@@ -5,8 +5,10 @@ This module contains all magic numbers, strings, and configuration
 values used throughout the application.
 """
 
+import re
+import sys
 from enum import Enum
-from typing import Final
+from typing import Any, Dict, Final, NamedTuple
 
 # ============================================================================
 # Application Metadata
@@ -43,63 +45,91 @@ MAX_CACHE_AGE_DAYS: Final[int] = 7
 MAX_DB_SIZE_MB: Final[int] = 50
 DATA_CLEANUP_DAYS: Final[int] = 30
 
+# ============================================================================
+# Dataclass Options
+# ============================================================================
+# Slotted dataclasses (no per-instance __dict__) where supported (3.10+)
+DATACLASS_OPTIONS: Final[Dict[str, Any]] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
 
 # ============================================================================
 # Theme Colors - Blue (Default)
 # ============================================================================
-class ThemeColors:
-    """Default blue glassmorphic theme colors."""
+class ThemePalette(NamedTuple):
+    """
+    Immutable theme color palette.
+
+    Field defaults are the default blue glassmorphic theme; variants are
+    derived with ``_replace``.
+    """
 
     # Backgrounds
-    WINDOW_BG: Final[str] = "#000000"
-    CONTAINER_BG: Final[str] = "#1a1a2e"
-    GLASS_BG: Final[str] = "#16213e"
-    CONTENT_BG: Final[str] = "#16213e"
+    WINDOW_BG: str = "#000000"
+    CONTAINER_BG: str = "#1a1a2e"
+    GLASS_BG: str = "#16213e"
+    CONTENT_BG: str = "#16213e"
 
     # Accents
-    PRIMARY_ACCENT: Final[str] = "#4a9eff"
-    SECONDARY_ACCENT: Final[str] = "#7bb3ff"
-    HIGHLIGHT: Final[str] = "#4a6fa5"
-    BORDER: Final[str] = "#0f3460"
+    PRIMARY_ACCENT: str = "#4a9eff"
+    SECONDARY_ACCENT: str = "#7bb3ff"
+    HIGHLIGHT: str = "#4a6fa5"
+    BORDER: str = "#0f3460"
 
     # Gradient colors for glassmorphic effect
-    GRADIENT_COLORS: Final[tuple] = ("#16213e", "#1a1a2e", "#0f3460")
+    GRADIENT_COLORS: tuple = ("#16213e", "#1a1a2e", "#0f3460")
 
     # Text
-    TITLE_COLOR: Final[str] = "#4a9eff"
-    SUBTITLE_COLOR: Final[str] = "#7bb3ff"
-    TEXT_COLOR: Final[str] = "#ffffff"
-    MUTED_TEXT: Final[str] = "#b0b0b0"
+    TITLE_COLOR: str = "#4a9eff"
+    SUBTITLE_COLOR: str = "#7bb3ff"
+    TEXT_COLOR: str = "#ffffff"
+    MUTED_TEXT: str = "#b0b0b0"
 
     # Buttons
-    BUTTON_BG: Final[str] = "#2d4059"
-    BUTTON_FG: Final[str] = "#ffffff"
-    BUTTON_ACTIVE_BG: Final[str] = "#4a6fa5"
-    BUTTON_HOVER_BG: Final[str] = "#3a5068"
+    BUTTON_BG: str = "#2d4059"
+    BUTTON_FG: str = "#ffffff"
+    BUTTON_ACTIVE_BG: str = "#4a6fa5"
+    BUTTON_HOVER_BG: str = "#3a5068"
 
     # Status
-    DANGER_COLOR: Final[str] = "#ff6b6b"
-    SUCCESS_COLOR: Final[str] = "#51cf66"
-    WARNING_COLOR: Final[str] = "#ffd43b"
-    INFO_COLOR: Final[str] = "#4a9eff"
+    DANGER_COLOR: str = "#ff6b6b"
+    SUCCESS_COLOR: str = "#51cf66"
+    WARNING_COLOR: str = "#ffd43b"
+    INFO_COLOR: str = "#4a9eff"
 
     # Input
-    INPUT_BG: Final[str] = "#1a2451"
-    INPUT_FG: Final[str] = "#ffffff"
-    INPUT_BORDER: Final[str] = "#4a6fa5"
+    INPUT_BG: str = "#1a2451"
+    INPUT_FG: str = "#ffffff"
+    INPUT_BORDER: str = "#4a6fa5"
+
+
+def _intern_colors(palette: ThemePalette) -> ThemePalette:
+    """Intern every hex color string in a palette so equal colors share one object."""
+    return palette._make(
+        tuple(sys.intern(color) for color in value)
+        if isinstance(value, tuple)
+        else sys.intern(value)
+        for value in palette
+    )
+
+
+# Default blue glassmorphic theme colors
+ThemeColors: Final[ThemePalette] = _intern_colors(ThemePalette())
 
 
 # ============================================================================
 # COBRA Theme Colors - Red
 # ============================================================================
-class CobraThemeColors:
-    """COBRA red theme colors."""
-
-    PRIMARY_ACCENT: Final[str] = "#dc143c"
-    SECONDARY_ACCENT: Final[str] = "#ff6b6b"
-    HIGHLIGHT: Final[str] = "#8b0000"
-    TITLE_COLOR: Final[str] = "#dc143c"
-    SUBTITLE_COLOR: Final[str] = "#ff6b6b"
+CobraThemeColors: Final[ThemePalette] = _intern_colors(
+    ThemeColors._replace(
+        PRIMARY_ACCENT="#dc143c",
+        SECONDARY_ACCENT="#ff6b6b",
+        HIGHLIGHT="#8b0000",
+        TITLE_COLOR="#dc143c",
+        SUBTITLE_COLOR="#ff6b6b",
+    )
+)
 
 
 # ============================================================================
@@ -130,6 +160,18 @@ class FontConfig:
     SMALL_FONT: Final[tuple] = (FONT_FAMILY, SMALL_SIZE)
     LARGE_FONT: Final[tuple] = (FONT_FAMILY, LARGE_SIZE)
 
+    # All font tuples by short name, for single-lookup access in render paths
+    NAMED_FONTS: Final[dict[str, tuple]] = {
+        "title": TITLE_FONT,
+        "subtitle": SUBTITLE_FONT,
+        "body": BODY_FONT,
+        "button": BUTTON_FONT,
+        "section": SECTION_FONT,
+        "label": LABEL_FONT,
+        "small": SMALL_FONT,
+        "large": LARGE_FONT,
+    }
+
 
 # ============================================================================
 # Spacing and Layout
@@ -248,6 +290,22 @@ SEVERE_WEATHER_KEYWORDS: Final[list[str]] = [
     "advisory",
 ]
 
+# All keywords compiled into one case-insensitive alternation, so a description
+# is scanned once instead of once per keyword. Substring semantics are kept
+# (e.g. "thunderstorms" matches), mirroring the previous `keyword in text` checks.
+SEVERE_WEATHER_RE: Final[re.Pattern] = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in sorted(SEVERE_WEATHER_KEYWORDS, key=len, reverse=True)
+    ),
+    re.IGNORECASE,
+)
+
+
+def is_severe_weather(description: str) -> bool:
+    """Return True if a weather description contains any severe weather keyword."""
+    return SEVERE_WEATHER_RE.search(description) is not None
+
 
 # ============================================================================
 # File Paths
@@ -5,10 +5,15 @@ This module defines custom exception classes for better error handling
 and more specific error messages throughout the application.
 """
 
+import functools
+
 
 class WeatherDominatorError(Exception):
     """Base exception class for all Weather Dominator errors."""
 
+    # Whether callers may retry or fall back; checked by is_recoverable()
+    recoverable = False
+
     def __init__(self, message: str, details: str = None):
         """
         Initialize exception.
@@ -19,13 +24,29 @@ class WeatherDominatorError(Exception):
         """
         self.message = message
         self.details = details
+        # Format the full text once; args keeps only the message so that
+        # copies and unpickling rebuild subclasses from their own arguments
+        self._text = f"{message}: {details}" if details else message
         super().__init__(self.message)
 
     def __str__(self) -> str:
         """Return string representation."""
-        if self.details:
-            return f"{self.message}: {self.details}"
-        return self.message
+        return self._text
+
+    def __reduce__(self):
+        """Pickle/copy by restoring state rather than re-running __init__.
+
+        Subclasses take their own constructor arguments, which args does not
+        hold, so they cannot be rebuilt as cls(*args).
+        """
+        return _restore_error, (type(self), self.args, self.__dict__)
+
+
+def _restore_error(cls, args, state):
+    """Rebuild a WeatherDominatorError from its args and instance state."""
+    error = cls.__new__(cls, *args)
+    error.__dict__.update(state)
+    return error
 
 
 # ============================================================================
@@ -82,12 +103,14 @@ class CharacterAPIError(APIError):
 class NetworkError(APIError):
     """Raised when network connection fails."""
 
-    pass
+    recoverable = True
 
 
 class RateLimitError(APIError):
     """Raised when API rate limit is exceeded."""
 
+    recoverable = True
+
     def __init__(self, service: str, retry_after: int = None):
         message = f"Rate limit exceeded for {service}"
         if retry_after:
@@ -152,6 +175,8 @@ class DataError(WeatherDominatorError):
 class DataNotFoundError(DataError):
     """Raised when requested data is not found."""
 
+    recoverable = True
+
     def __init__(self, data_type: str, identifier: str):
         super().__init__(f"{data_type} not found", f"No data found for {identifier}")
         self.data_type = data_type
@@ -300,7 +325,7 @@ class FileReadError(FileError):
 class CacheError(WeatherDominatorError):
     """Base class for cache-related errors."""
 
-    pass
+    recoverable = True
 
 
 class CacheFullError(CacheError):
@@ -325,10 +350,14 @@ class CacheInvalidError(CacheError):
 # ============================================================================
 
 
+@functools.singledispatch
 def handle_error(error: Exception, fallback_message: str = "An error occurred") -> str:
     """
     Convert exception to user-friendly error message.
 
+    Dispatches on the exception type; application errors are registered
+    below and returned verbatim, anything else gets the fallback prefix.
+
     Args:
         error: Exception instance
         fallback_message: Message to use if error is generic
@@ -336,11 +365,17 @@ def handle_error(error: Exception, fallback_message: str = "An error occurred")
     Returns:
         User-friendly error message
     """
-    if isinstance(error, WeatherDominatorError):
-        return str(error)
-    return f"{fallback_message}: {str(error)}"
+    return f"{fallback_message}: {error}"
 
 
+@handle_error.register
+def _handle_app_error(
+    error: WeatherDominatorError, fallback_message: str = "An error occurred"
+) -> str:
+    return str(error)
+
+
+@functools.singledispatch
 def is_recoverable(error: Exception) -> bool:
     """
     Check if error is recoverable.
@@ -351,8 +386,12 @@ def is_recoverable(error: Exception) -> bool:
     Returns:
         True if error is recoverable, False otherwise
     """
-    recoverable_errors = (NetworkError, RateLimitError, CacheError, DataNotFoundError)
-    return isinstance(error, recoverable_errors)
+    return False
+
+
+@is_recoverable.register
+def _is_app_error_recoverable(error: WeatherDominatorError) -> bool:
+    return error.recoverable
 
 
 # Example usage
@@ -5,12 +5,50 @@ This module provides centralized logging configuration with support for
 console and file handlers, log rotation, and structured logging.
 """
 
+import atexit
+import functools
 import logging
 import logging.handlers
+import queue
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+
+
+def _render_level_prefixes(colors: dict, icons: dict) -> dict:
+    """
+    Pre-render the colored, iconified name for each level.
+
+    Args:
+        colors: Level name to ANSI color code, including a "RESET" entry
+        icons: Level name to emoji prefix
+
+    Returns:
+        Dictionary mapping level name to its rendered form
+    """
+    reset = colors["RESET"]
+    return {
+        name: f"{color}{icons.get(name, '')} {name}{reset}"
+        for name, color in colors.items()
+        if name != "RESET"
+    }
+
+
+def _index_by_levelno(prefixes: dict) -> tuple:
+    """
+    Lay out per-level strings in a tuple indexed by numeric level.
+
+    Args:
+        prefixes: Standard level name to rendered string
+
+    Returns:
+        Tuple of length CRITICAL + 1 with None for unmapped levels
+    """
+    table: List[Optional[str]] = [None] * (logging.CRITICAL + 1)
+    for name, prefix in prefixes.items():
+        table[getattr(logging, name)] = prefix
+    return tuple(table)
 
 
 class ColoredFormatter(logging.Formatter):
@@ -35,6 +73,13 @@ class ColoredFormatter(logging.Formatter):
         "CRITICAL": "🚨",
     }
 
+    # Fully rendered level names, built once rather than on every record
+    _LEVEL_PREFIX = _render_level_prefixes(COLORS, ICONS)
+
+    # The same strings indexed directly by record.levelno; None for levels
+    # without a color (custom or NOTSET)
+    _LEVEL_TABLE = _index_by_levelno(_LEVEL_PREFIX)
+
     def format(self, record):
         """
         Format log record with colors and icons.
@@ -45,16 +90,65 @@ class ColoredFormatter(logging.Formatter):
         Returns:
             Formatted log string
         """
-        # Add color
+        # Add color, restoring the plain name so other handlers (e.g. the
+        # log file) never see the ANSI escapes on the shared record
+        levelno = record.levelno
+        table = self._LEVEL_TABLE
+        prefix = table[levelno] if 0 <= levelno < len(table) else None
+        if prefix is None:
+            return super().format(record)
+
         levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = (
-                f"{self.COLORS[levelname]}"
-                f"{self.ICONS.get(levelname, '')} {levelname}"
-                f"{self.COLORS['RESET']}"
-            )
+        record.levelname = prefix
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+
+
+class FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that checks size without re-formatting records.
+
+    The stdlib handler formats every record twice: once in shouldRollover()
+    to measure it and again in emit(). This variant rolls over once the file
+    has already reached maxBytes, so a log may overshoot by one record.
+    """
+
+    def shouldRollover(self, record):
+        """
+        Determine if the log file has reached its size limit.
+
+        Args:
+            record: LogRecord instance (unused)
+
+        Returns:
+            True if the file should be rotated before writing
+        """
+        return (
+            self.stream is not None
+            and self.maxBytes > 0
+            and self.stream.tell() >= self.maxBytes
+        )
 
-        return super().format(record)
+
+# Whether stdout is an interactive terminal, checked once per process
+_STDOUT_IS_TTY = sys.stdout is not None and sys.stdout.isatty()
+
+# Formatters are stateless, so every handler shares these instances
+_FILE_FORMAT = (
+    "%(asctime)s - %(name)s - %(levelname)s - "
+    "%(module)s:%(funcName)s:%(lineno)d - %(message)s"
+)
+_FILE_DATEFMT = "%Y-%m-%d %H:%M:%S"
+_CONSOLE_FORMAT = "%(levelname)s - %(message)s"
+
+_FILE_FORMATTER = logging.Formatter(_FILE_FORMAT, datefmt=_FILE_DATEFMT)
+_CONSOLE_FORMATTER = logging.Formatter(_CONSOLE_FORMAT)
+_COLORED_FORMATTER = ColoredFormatter(_CONSOLE_FORMAT)
+
+# Instance currently driving each named logger, so a replacement can retire it
+_ACTIVE_LOGGERS: Dict[str, "WeatherDominatorLogger"] = {}
 
 
 class WeatherDominatorLogger:
@@ -98,6 +192,11 @@ class WeatherDominatorLogger:
         self.console_output = console_output
         self.colored_console = colored_console
 
+        # Background thread that drains queued records into the real handlers
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        self._queue_handler: Optional[logging.handlers.QueueHandler] = None
+        self._handlers: Tuple[logging.Handler, ...] = ()
+
         # Create logger
         self.logger = self._setup_logger()
 
@@ -105,34 +204,54 @@ class WeatherDominatorLogger:
         """
         Set up logger with handlers and formatters.
 
+        Log calls only enqueue records; a QueueListener thread formats them
+        and performs the file and console I/O off the caller's thread.
+
         Returns:
             Configured Logger instance
         """
         logger = logging.getLogger(self.name)
         logger.setLevel(self.level)
 
+        # Retire an earlier instance on this name so its listener thread,
+        # handlers and exit hook don't outlive it
+        previous = _ACTIVE_LOGGERS.pop(self.name, None)
+        if previous is not None:
+            previous._release()
+
         # Remove existing handlers to avoid duplicates
         logger.handlers.clear()
 
+        handlers: List[logging.Handler] = []
+
         # File handler with rotation
-        if self._setup_file_handler(logger):
-            pass  # File handler added successfully
+        file_handler = self._setup_file_handler()
+        if file_handler is not None:
+            handlers.append(file_handler)
 
         # Console handler
         if self.console_output:
-            self._setup_console_handler(logger)
+            handlers.append(self._setup_console_handler())
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._queue_handler = logging.handlers.QueueHandler(log_queue)
+        logger.addHandler(self._queue_handler)
+        self._listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        self._listener.start()
+        self._handlers = tuple(handlers)
+        _ACTIVE_LOGGERS[self.name] = self
+        atexit.register(self.shutdown)
 
         return logger
 
-    def _setup_file_handler(self, logger: logging.Logger) -> bool:
+    def _setup_file_handler(self) -> Optional[logging.Handler]:
         """
         Set up rotating file handler.
 
-        Args:
-            logger: Logger instance
-
         Returns:
-            True if successful, False otherwise
+            Configured handler, or None if the log file cannot be opened
         """
         try:
             # Create log directory if it doesn't exist
@@ -141,7 +260,7 @@ class WeatherDominatorLogger:
             log_path = self.log_dir / self.log_file
 
             # Rotating file handler
-            file_handler = logging.handlers.RotatingFileHandler(
+            file_handler = FastRotatingFileHandler(
                 log_path,
                 maxBytes=self.max_bytes,
                 backupCount=self.backup_count,
@@ -149,42 +268,63 @@ class WeatherDominatorLogger:
             )
 
             # Detailed format for file logs
-            file_formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - "
-                "%(module)s:%(funcName)s:%(lineno)d - %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-            )
-            file_handler.setFormatter(file_formatter)
+            file_handler.setFormatter(_FILE_FORMATTER)
             file_handler.setLevel(self.level)
 
-            logger.addHandler(file_handler)
-            return True
+            return file_handler
 
         except Exception as e:
             print(f"Warning: Could not setup file logging: {e}")
-            return False
+            return None
 
-    def _setup_console_handler(self, logger: logging.Logger):
+    def _setup_console_handler(self) -> logging.Handler:
         """
         Set up console handler.
 
-        Args:
-            logger: Logger instance
+        Returns:
+            Configured handler
         """
         console_handler = logging.StreamHandler(sys.stdout)
 
         # Choose formatter based on color setting
-        if self.colored_console and sys.stdout.isatty():
-            console_formatter: logging.Formatter = ColoredFormatter(
-                "%(levelname)s - %(message)s"
-            )
+        if self.colored_console and _STDOUT_IS_TTY:
+            console_handler.setFormatter(_COLORED_FORMATTER)
         else:
-            console_formatter = logging.Formatter("%(levelname)s - %(message)s")
+            console_handler.setFormatter(_CONSOLE_FORMATTER)
 
-        console_handler.setFormatter(console_formatter)
         console_handler.setLevel(self.level)
 
-        logger.addHandler(console_handler)
+        return console_handler
+
+    def shutdown(self):
+        """
+        Stop the background listener, flushing any queued records.
+
+        Handlers owned by the listener are re-attached directly to the
+        logger so messages logged after shutdown are still written.
+        """
+        listener = self._listener
+        if listener is None:
+            return
+        self._listener = None
+        listener.stop()
+
+        # Leave the logger alone if another instance has since reconfigured it
+        if self._queue_handler in self.logger.handlers:
+            self.logger.removeHandler(self._queue_handler)
+            for handler in listener.handlers:
+                self.logger.addHandler(handler)
+
+    def _release(self):
+        """Stop the listener, close owned handlers and drop the exit hook"""
+        atexit.unregister(self.shutdown)
+        listener = self._listener
+        self._listener = None
+        if listener is not None:
+            listener.stop()
+        for handler in self._handlers:
+            handler.close()
+        self._handlers = ()
 
     def get_logger(self) -> logging.Logger:
         """
@@ -203,7 +343,10 @@ class WeatherDominatorLogger:
             level: Logging level (logging.DEBUG, INFO, WARNING, ERROR, CRITICAL)
         """
         self.logger.setLevel(level)
-        for handler in self.logger.handlers:
+        handlers = list(self.logger.handlers)
+        if self._listener is not None:
+            handlers.extend(self._listener.handlers)
+        for handler in handlers:
             handler.setLevel(level)
 
     def add_handler(self, handler: logging.Handler):
@@ -217,23 +360,29 @@ class WeatherDominatorLogger:
 
     def log_startup(self):
         """Log application startup information."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.logger.info("=" * 60)
         self.logger.info("Weather Dominator Application Starting")
-        self.logger.info(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        self.logger.info(f"Log Level: {logging.getLevelName(self.level)}")
-        self.logger.info(f"Log Directory: {self.log_dir}")
+        self.logger.info("Timestamp: %s", time.strftime(_FILE_DATEFMT))
+        self.logger.info("Log Level: %s", logging.getLevelName(self.level))
+        self.logger.info("Log Directory: %s", self.log_dir)
         self.logger.info("=" * 60)
 
     def log_shutdown(self):
-        """Log application shutdown information."""
-        self.logger.info("=" * 60)
-        self.logger.info("Weather Dominator Application Shutting Down")
-        self.logger.info(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        self.logger.info("=" * 60)
+        """Log application shutdown information and flush queued records."""
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("=" * 60)
+            self.logger.info("Weather Dominator Application Shutting Down")
+            self.logger.info("Timestamp: %s", time.strftime(_FILE_DATEFMT))
+            self.logger.info("=" * 60)
+        self.shutdown()
 
 
 # Global logger instance
 _logger_instance: Optional[WeatherDominatorLogger] = None
+# Its configured logger, cached so get_logger() skips the instance lookup
+_ROOT_LOGGER: Optional[logging.Logger] = None
 
 
 def setup_logging(
@@ -254,7 +403,7 @@ def setup_logging(
     Returns:
         Configured logger instance
     """
-    global _logger_instance
+    global _logger_instance, _ROOT_LOGGER
 
     if _logger_instance is None:
         _logger_instance = WeatherDominatorLogger(
@@ -263,11 +412,26 @@ def setup_logging(
             console_output=console_output,
             colored_console=colored,
         )
+        _ROOT_LOGGER = _logger_instance.get_logger()
         _logger_instance.log_startup()
 
     return _logger_instance.get_logger()
 
 
+@functools.lru_cache(maxsize=None)
+def _named_logger(name: str) -> logging.Logger:
+    """
+    Look up a child of the application logger, caching the result.
+
+    Args:
+        name: Child logger name
+
+    Returns:
+        Logger instance
+    """
+    return logging.getLogger(f"WeatherDominator.{name}")
+
+
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """
     Get logger instance.
@@ -279,12 +443,9 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
         Logger instance
     """
     if name:
-        return logging.getLogger(f"WeatherDominator.{name}")
+        return _named_logger(name)
 
-    if _logger_instance is None:
-        return setup_logging()
-
-    return _logger_instance.get_logger()
+    return _ROOT_LOGGER or setup_logging()
 
 
 def log_exception(logger: logging.Logger, exc: Exception, context: str = ""):
@@ -296,32 +457,49 @@ def log_exception(logger: logging.Logger, exc: Exception, context: str = ""):
         exc: Exception to log
         context: Optional context message
     """
-    if context:
-        logger.error(f"{context}: {type(exc).__name__}: {exc}", exc_info=True)
-    else:
-        logger.error(f"{type(exc).__name__}: {exc}", exc_info=True)
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+    logger.error(
+        "%s%s: %s",
+        f"{context}: " if context else "",
+        type(exc).__name__,
+        exc,
+        exc_info=True,
+    )
 
 
 def log_function_call(func):
     """
     Decorator to log function calls.
 
+    The logging level is checked once, at decoration time: if DEBUG is not
+    enabled for the function's module logger then, the function is returned
+    unwrapped and calls (including failures) are not logged at all.
+
     Args:
         func: Function to decorate
 
     Returns:
-        Decorated function
+        Decorated function, or func itself when DEBUG logging is off
     """
+    # func.__module__ is fixed, so resolve the logger once per function
+    logger = get_logger(func.__module__)
+    if logger.getEffectiveLevel() > logging.DEBUG:
+        return func
 
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        logger = get_logger(func.__module__)
-        logger.debug(f"Calling {func.__name__}(*{args}, **{kwargs})")
+        # Skip repr()-ing the arguments entirely when DEBUG is filtered out
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug("Calling %s(*%r, **%r)", func.__name__, args, kwargs)
         try:
             result = func(*args, **kwargs)
-            logger.debug(f"{func.__name__} completed successfully")
+            if debug_enabled:
+                logger.debug("%s completed successfully", func.__name__)
             return result
         except Exception as e:
-            logger.error(f"{func.__name__} failed: {e}", exc_info=True)
+            logger.error("%s failed: %s", func.__name__, e, exc_info=True)
             raise
 
     return wrapper
@@ -351,7 +529,7 @@ if __name__ == "__main__":
         return x + y
 
     result = test_function(5, 3)
-    logger.info(f"Result: {result}")
+    logger.info("Result: %s", result)
 
     # Shutdown
     if _logger_instance:
@@ -27,6 +27,30 @@ def test_data_dir():
         shutil.rmtree(data_dir)
 
 
+@pytest.fixture(scope="session")
+def const():
+    """Fixture providing the src.constants module, imported on first use"""
+    import src.constants as constants
+
+    return constants
+
+
+@pytest.fixture(scope="session", autouse=True)
+def configure_logging():
+    """Fixture running the application's logging setup once per session"""
+    from src.logger import setup_logging
+
+    yield setup_logging()
+
+
+@pytest.fixture(scope="session")
+def shared_logger():
+    """Fixture providing one application logger shared by all tests"""
+    from src.logger import get_logger
+
+    return get_logger("tests.shared")
+
+
 @pytest.fixture
 def temp_dir():
     """Fixture providing a temporary directory for each test"""
@@ -5,11 +5,13 @@ Tests for configuration management.
 import json
 import os
 import tempfile
+import time
 from pathlib import Path
-from threading import Thread
+from threading import Barrier, Thread
 
 import pytest
 
+import src.config_manager as config_module
 from src.config_manager import (APIKeys, AppConfig, CacheSettings,
                                 ConfigManager, DatabaseSettings, Preferences,
                                 get_config_manager)
@@ -67,6 +69,34 @@ class TestConfigManager:
         manager = get_config_manager()
         assert isinstance(manager, ConfigManager)
     
+    def test_get_config_manager_concurrent_calls(self, monkeypatch):
+        """Test get_config_manager() creates one instance across threads."""
+        monkeypatch.setattr(config_module, "_config_manager", None)
+        created = []
+        
+        def slow_manager(config_path=None):
+            # Widen the window in which an unlocked check would race
+            time.sleep(0.01)
+            created.append(config_path)
+            return ConfigManager(config_path)
+        
+        monkeypatch.setattr(config_module, "ConfigManager", slow_manager)
+        barrier = Barrier(10)
+        results = []
+        
+        def worker():
+            barrier.wait()
+            results.append(get_config_manager())
+        
+        threads = [Thread(target=worker) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(created) == 1
+        assert len(set(id(r) for r in results)) == 1
+    
     def test_load_config_success(self, temp_config_file):
         """Test successful configuration loading."""
         config_manager = ConfigManager(temp_config_file)
@@ -135,6 +165,52 @@ class TestConfigManager:
         new_manager = ConfigManager(temp_config_file)
         assert new_manager.get_api_key('openweather') == 'updated_key'
     
+    def test_autosave_delay_coalesces_writes(self, temp_config_file):
+        """Test delayed autosave defers setter writes until flushed."""
+        config_manager = ConfigManager(temp_config_file, autosave_delay=60)
+        assert config_manager.set_api_key('openweather', 'pending_key') is True
+        assert config_manager.set_preference('theme', 'default') is True
+        
+        # Nothing written yet
+        assert ConfigManager(temp_config_file).get_api_key('openweather') == 'test_weather_key_123'
+        
+        assert config_manager.save_config() is True
+        reloaded = ConfigManager(temp_config_file)
+        assert reloaded.get_api_key('openweather') == 'pending_key'
+        assert reloaded.get_preference('theme') == 'default'
+    
+    def test_direct_edits_survive_setter_write(self, temp_config_file):
+        """Test setters also persist edits made directly on the config object."""
+        config_manager = ConfigManager(temp_config_file)
+        config_manager.config.cache.max_age_days = 99
+        assert config_manager.set_preference('theme', 'dark') is True
+        
+        reloaded = ConfigManager(temp_config_file)
+        assert reloaded.config.cache.max_age_days == 99
+        assert reloaded.get_preference('theme') == 'dark'
+    
+    def test_flush_pending_writes_delayed_changes(self, temp_config_file):
+        """Test a pending delayed write can be forced, as done at exit."""
+        config_manager = ConfigManager(temp_config_file, autosave_delay=60)
+        config_manager.set_preference('theme', 'default')
+        
+        assert config_manager.flush_pending() is True
+        assert ConfigManager(temp_config_file).get_preference('theme') == 'default'
+    
+    def test_exit_hook_released_after_flush(self, temp_config_file, monkeypatch):
+        """Test the exit hook is only held while a delayed write is pending."""
+        registered = []
+        monkeypatch.setattr(config_module.atexit, 'register', registered.append)
+        monkeypatch.setattr(config_module.atexit, 'unregister', registered.remove)
+        config_manager = ConfigManager(temp_config_file, autosave_delay=60)
+        
+        config_manager.set_preference('theme', 'dark')
+        config_manager.set_preference('theme', 'default')
+        assert registered == [config_manager.flush_pending]
+        
+        config_manager.flush_pending()
+        assert registered == []
+    
     def test_validate_config(self, temp_config_file):
         """Test configuration validation."""
         config_manager = ConfigManager(temp_config_file)
@@ -155,6 +231,25 @@ class TestConfigManager:
         assert 'openweather_configured' in summary
         assert summary['temperature_unit'] == 'F'
     
+    def test_config_summary_refreshes_after_setter(self, temp_config_file):
+        """Test summary and validation reflect values changed through setters."""
+        config_manager = ConfigManager(temp_config_file)
+        assert config_manager.get_config_summary()['temperature_unit'] == 'F'
+        assert config_manager.validate_config()['valid_units'] is True
+        
+        config_manager.set_preference('temperature_unit', 'K')
+        assert config_manager.get_config_summary()['temperature_unit'] == 'K'
+        assert config_manager.validate_config()['valid_units'] is False
+    
+    def test_validation_sees_direct_edits(self, temp_config_file):
+        """Test validation reflects edits made directly on the config object."""
+        config_manager = ConfigManager(temp_config_file)
+        assert config_manager.validate_config()['valid_units'] is True
+        
+        config_manager.config.preferences.temperature_unit = 'K'
+        assert config_manager.validate_config()['valid_units'] is False
+        assert config_manager.get_config_summary()['temperature_unit'] == 'K'
+    
     def test_reset_to_defaults(self, temp_config_file):
         """Test resetting configuration to defaults."""
         config_manager = ConfigManager(temp_config_file)
@@ -193,6 +288,21 @@ class TestConfigManager:
         key = config_manager.get_api_key('openweather')
         assert key == 'env_key_from_env'
     
+    def test_unchanged_file_is_parsed_once(self, temp_config_file, monkeypatch):
+        """Test repeated loads of an unchanged file reuse the parsed data."""
+        calls = []
+        monkeypatch.setattr(config_module, '_PARSE_CACHE', {})
+        original_loader = config_module._load_json_file
+        monkeypatch.setattr(config_module, '_load_json_file',
+                            lambda path: calls.append(path) or original_loader(path))
+        
+        ConfigManager(temp_config_file)
+        second = ConfigManager(temp_config_file)
+        third = ConfigManager(temp_config_file)
+        assert len(calls) == 1
+        assert third.get_preference('theme') == 'cobra'
+        assert second.get_api_key('openweather') == 'test_weather_key_123'
+    
     def test_thread_safety(self, temp_config_file):
         """Test concurrent access to ConfigManager."""
         results = []
@@ -234,3 +344,11 @@ class TestDataClasses:
         assert isinstance(config.preferences, Preferences)
         assert isinstance(config.cache, CacheSettings)
         assert isinstance(config.database, DatabaseSettings)
+    
+    def test_app_config_from_dict_is_lazy(self):
+        """Test AppConfig.from_dict builds sections on first access."""
+        config = AppConfig.from_dict({'database': {'path': 'lazy.db'}})
+        assert config._sections == {}
+        assert config.database.path == 'lazy.db'
+        assert list(config._sections) == ['database']
+        assert isinstance(config.preferences, Preferences)
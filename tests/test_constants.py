@@ -2,156 +2,148 @@
 Tests for application constants.
 """
 
-import pytest
+import sys
 
-from src.constants import (  # Application metadata; Window dimensions; Theme classes; API configuration; Enums
-    APP_DESCRIPTION, APP_NAME, APP_VERSION, GIJOE_FANDOM_API, GIJOE_WIKI_URL,
-    OPENWEATHER_BASE_URL, WINDOW_HEIGHT, WINDOW_MIN_HEIGHT, WINDOW_MIN_WIDTH,
-    WINDOW_WIDTH, CobraThemeColors, Faction, FontConfig, LogLevel,
-    PredictionType, SearchType, ThemeColors)
+import pytest
 
 
 class TestModuleLevelConstants:
     """Test module-level application constants."""
     
-    def test_app_metadata_exists(self):
+    def test_app_metadata_exists(self, const):
         """Test that app metadata constants are defined."""
-        assert isinstance(APP_NAME, str)
-        assert isinstance(APP_VERSION, str)
-        assert isinstance(APP_DESCRIPTION, str)
-        assert len(APP_NAME) > 0
-        assert len(APP_VERSION) > 0
+        assert isinstance(const.APP_NAME, str)
+        assert isinstance(const.APP_VERSION, str)
+        assert isinstance(const.APP_DESCRIPTION, str)
+        assert len(const.APP_NAME) > 0
+        assert len(const.APP_VERSION) > 0
     
-    def test_window_dimensions(self):
+    def test_window_dimensions(self, const):
         """Test window dimension constants."""
-        assert isinstance(WINDOW_WIDTH, int)
-        assert isinstance(WINDOW_HEIGHT, int)
-        assert isinstance(WINDOW_MIN_WIDTH, int)
-        assert isinstance(WINDOW_MIN_HEIGHT, int)
-        assert WINDOW_WIDTH > 0
-        assert WINDOW_HEIGHT > 0
-        assert WINDOW_WIDTH >= WINDOW_MIN_WIDTH
-        assert WINDOW_HEIGHT >= WINDOW_MIN_HEIGHT
-    
-    def test_api_urls(self):
+        assert isinstance(const.WINDOW_WIDTH, int)
+        assert isinstance(const.WINDOW_HEIGHT, int)
+        assert isinstance(const.WINDOW_MIN_WIDTH, int)
+        assert isinstance(const.WINDOW_MIN_HEIGHT, int)
+        assert const.WINDOW_WIDTH > 0
+        assert const.WINDOW_HEIGHT > 0
+        assert const.WINDOW_WIDTH >= const.WINDOW_MIN_WIDTH
+        assert const.WINDOW_HEIGHT >= const.WINDOW_MIN_HEIGHT
+    
+    def test_api_urls(self, const):
         """Test API URL constants."""
-        assert isinstance(OPENWEATHER_BASE_URL, str)
-        assert isinstance(GIJOE_FANDOM_API, str)
-        assert isinstance(GIJOE_WIKI_URL, str)
-        assert OPENWEATHER_BASE_URL.startswith('http')
-        assert GIJOE_FANDOM_API.startswith('http')
-        assert GIJOE_WIKI_URL.startswith('http')
+        assert isinstance(const.OPENWEATHER_BASE_URL, str)
+        assert isinstance(const.GIJOE_FANDOM_API, str)
+        assert isinstance(const.GIJOE_WIKI_URL, str)
+        assert const.OPENWEATHER_BASE_URL.startswith('http')
+        assert const.GIJOE_FANDOM_API.startswith('http')
+        assert const.GIJOE_WIKI_URL.startswith('http')
 
 
 class TestThemeColors:
     """Test ThemeColors class attributes."""
     
-    def test_theme_colors_exist(self):
-        """Test that theme color attributes exist."""
-        # Background colors
-        assert hasattr(ThemeColors, 'WINDOW_BG')
-        assert hasattr(ThemeColors, 'CONTAINER_BG')
-        assert hasattr(ThemeColors, 'GLASS_BG')
-        
-        # Accent colors
-        assert hasattr(ThemeColors, 'PRIMARY_ACCENT')
-        assert hasattr(ThemeColors, 'SECONDARY_ACCENT')
-        
-        # Text colors
-        assert hasattr(ThemeColors, 'TITLE_COLOR')
-        assert hasattr(ThemeColors, 'TEXT_COLOR')
-    
-    def test_theme_colors_are_strings(self):
-        """Test that theme colors are hex color strings."""
-        colors = [
-            ThemeColors.WINDOW_BG,
-            ThemeColors.PRIMARY_ACCENT,
-            ThemeColors.TEXT_COLOR
-        ]
-        
-        for color in colors:
-            assert isinstance(color, str)
-            assert color.startswith('#')
-    
-    def test_cobra_theme_colors(self):
+    @pytest.mark.parametrize("attr", [
+        'WINDOW_BG', 'CONTAINER_BG', 'GLASS_BG', 'PRIMARY_ACCENT',
+        'SECONDARY_ACCENT', 'TITLE_COLOR', 'TEXT_COLOR',
+    ])
+    def test_theme_color_attr(self, const, attr):
+        """Test that theme colors are defined as hex color strings."""
+        value = getattr(const.ThemeColors, attr)
+        assert isinstance(value, str)
+        assert value.startswith('#')
+    
+    def test_cobra_theme_colors(self, const):
         """Test COBRA theme color overrides."""
-        assert hasattr(CobraThemeColors, 'PRIMARY_ACCENT')
-        assert isinstance(CobraThemeColors.PRIMARY_ACCENT, str)
-        assert CobraThemeColors.PRIMARY_ACCENT.startswith('#')
+        assert hasattr(const.CobraThemeColors, 'PRIMARY_ACCENT')
+        assert isinstance(const.CobraThemeColors.PRIMARY_ACCENT, str)
+        assert const.CobraThemeColors.PRIMARY_ACCENT.startswith('#')
+    
+    def test_cobra_palette_derives_from_default(self, const):
+        """Test COBRA palette only overrides accents and is immutable."""
+        assert const.CobraThemeColors.GLASS_BG == const.ThemeColors.GLASS_BG
+        assert const.CobraThemeColors.PRIMARY_ACCENT != const.ThemeColors.PRIMARY_ACCENT
+        with pytest.raises(AttributeError):
+            const.ThemeColors.GLASS_BG = "#ffffff"
+    
+    @pytest.mark.parametrize("palette", ['ThemeColors', 'CobraThemeColors'])
+    def test_palette_colors_are_interned(self, const, palette):
+        """Test that palette hex strings are the interned instances."""
+        for value in getattr(const, palette):
+            for color in value if isinstance(value, tuple) else (value,):
+                assert color is sys.intern(''.join(color))
 
 
 class TestFontConfig:
     """Test FontConfig class attributes."""
     
-    def test_font_config_exists(self):
-        """Test that font configuration attributes exist."""
-        assert hasattr(FontConfig, 'FONT_FAMILY')
-        assert hasattr(FontConfig, 'TITLE_SIZE')
-        assert hasattr(FontConfig, 'BODY_SIZE')
-        assert hasattr(FontConfig, 'SMALL_SIZE')
-    
-    def test_font_family(self):
-        """Test font family is a string."""
-        assert isinstance(FontConfig.FONT_FAMILY, str)
-        assert len(FontConfig.FONT_FAMILY) > 0
-    
-    def test_font_sizes_are_positive(self):
-        """Test that font sizes are positive integers."""
-        sizes = [
-            FontConfig.TITLE_SIZE,
-            FontConfig.BODY_SIZE,
-            FontConfig.SMALL_SIZE
-        ]
-        
-        for size in sizes:
-            assert isinstance(size, int)
-            assert size > 0
+    @pytest.mark.parametrize("attr, expected_type", [
+        ('FONT_FAMILY', str),
+        ('TITLE_SIZE', int),
+        ('BODY_SIZE', int),
+        ('SMALL_SIZE', int),
+    ])
+    def test_font_config_attr(self, const, attr, expected_type):
+        """Test that font settings exist with the expected type."""
+        value = getattr(const.FontConfig, attr)
+        assert isinstance(value, expected_type)
+        if expected_type is int:
+            assert value > 0
+        else:
+            assert len(value) > 0
 
 
 class TestEnumerations:
     """Test enum classes."""
     
-    def test_search_type_enum(self):
+    def test_search_type_enum(self, const):
         """Test SearchType enumeration."""
-        assert hasattr(SearchType, 'WEATHER')
-        assert hasattr(SearchType, 'CHARACTER')
+        assert {'WEATHER', 'CHARACTER'} <= const.SearchType.__members__.keys()
     
-    def test_prediction_type_enum(self):
+    def test_prediction_type_enum(self, const):
         """Test PredictionType enumeration."""
-        assert hasattr(PredictionType, 'TEMPERATURE')
-        assert hasattr(PredictionType, 'HUMIDITY')
-        assert hasattr(PredictionType, 'SEVERE_WEATHER')
+        expected = {'TEMPERATURE', 'HUMIDITY', 'SEVERE_WEATHER'}
+        assert expected <= const.PredictionType.__members__.keys()
     
-    def test_log_level_enum(self):
+    def test_log_level_enum(self, const):
         """Test LogLevel enumeration."""
-        assert hasattr(LogLevel, 'DEBUG')
-        assert hasattr(LogLevel, 'INFO')
-        assert hasattr(LogLevel, 'WARNING')
-        assert hasattr(LogLevel, 'ERROR')
-        assert hasattr(LogLevel, 'CRITICAL')
+        expected = {'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'}
+        assert expected <= const.LogLevel.__members__.keys()
     
-    def test_faction_enum(self):
+    def test_faction_enum(self, const):
         """Test Faction enumeration."""
-        assert hasattr(Faction, 'COBRA')
-        assert hasattr(Faction, 'GI_JOE')
-        assert hasattr(Faction, 'INDEPENDENT')
-        assert hasattr(Faction, 'UNKNOWN')
+        assert {'COBRA', 'GI_JOE', 'INDEPENDENT', 'UNKNOWN'} <= const.Faction.__members__.keys()
+
+
+class TestSevereWeather:
+    """Test severe weather keyword matching."""
+    
+    @pytest.mark.parametrize("description, expected", [
+        ("Thunderstorm with heavy rain", True),
+        ("TORNADO WARNING", True),
+        ("scattered storms", True),
+        ("clear sky", False),
+        ("", False),
+    ])
+    def test_is_severe_weather(self, const, description, expected):
+        """Test keyword detection is case-insensitive substring matching."""
+        assert const.is_severe_weather(description) is expected
 
 
 class TestConstantsIntegrity:
     """Test relationships and integrity between constants."""
     
-    def test_window_min_dimensions_valid(self):
+    def test_window_min_dimensions_valid(self, const):
         """Test that minimum dimensions are reasonable."""
-        assert WINDOW_MIN_WIDTH >= 400
-        assert WINDOW_MIN_HEIGHT >= 300
+        assert const.WINDOW_MIN_WIDTH >= 400
+        assert const.WINDOW_MIN_HEIGHT >= 300
     
-    def test_font_sizes_ordered(self):
+    def test_font_sizes_ordered(self, const):
         """Test that font sizes follow logical ordering."""
-        assert FontConfig.TITLE_SIZE > FontConfig.BODY_SIZE
-        assert FontConfig.BODY_SIZE > FontConfig.SMALL_SIZE
+        fonts = const.FontConfig
+        sizes = [fonts.TITLE_SIZE, fonts.BODY_SIZE, fonts.SMALL_SIZE]
+        assert sizes == sorted(set(sizes), reverse=True)
     
-    def test_api_urls_complete(self):
+    def test_api_urls_complete(self, const):
         """Test that all required API URLs are defined."""
-        assert 'openweathermap.org' in OPENWEATHER_BASE_URL
-        assert 'fandom.com' in GIJOE_FANDOM_API or 'wikia.com' in GIJOE_FANDOM_API
+        assert 'openweathermap.org' in const.OPENWEATHER_BASE_URL
+        assert const.GIJOE_FANDOM_API.startswith('https://gijoe.fandom.com/')
@@ -1,12 +1,20 @@
 """
 Tests for src.exceptions module
 """
+import copy
+import pickle
+
 import pytest
 
-from src.exceptions import (APIError, ConfigurationError, DatabaseError,
+from src.exceptions import (APIError, APIKeyMissingError, CacheFullError,
+                            ConfigurationError, DatabaseError,
+                            DataNotFoundError, NetworkError, RateLimitError,
                             ValidationError, WeatherDominatorError,
                             handle_error, is_recoverable)
 
+# Direct subclasses of WeatherDominatorError shared by parametrized tests
+SUBCLASSES = [ConfigurationError, APIError, DatabaseError, ValidationError]
+
 
 class TestExceptionHierarchy:
     """Test exception class hierarchy"""
@@ -15,21 +23,10 @@ class TestExceptionHierarchy:
         """Test that base exception class exists"""
         assert issubclass(WeatherDominatorError, Exception)
     
-    def test_configuration_error_inheritance(self):
-        """Test ConfigurationError inherits from base"""
-        assert issubclass(ConfigurationError, WeatherDominatorError)
-    
-    def test_api_error_inheritance(self):
-        """Test APIError inherits from base"""
-        assert issubclass(APIError, WeatherDominatorError)
-    
-    def test_database_error_inheritance(self):
-        """Test DatabaseError inherits from base"""
-        assert issubclass(DatabaseError, WeatherDominatorError)
-    
-    def test_validation_error_inheritance(self):
-        """Test ValidationError inherits from base"""
-        assert issubclass(ValidationError, WeatherDominatorError)
+    @pytest.mark.parametrize("cls", SUBCLASSES)
+    def test_inherits_base(self, cls, _base=WeatherDominatorError):
+        """Test that each error family inherits from the base"""
+        assert issubclass(cls, _base)
 
 
 class TestWeatherDominatorError:
@@ -42,10 +39,8 @@ class TestWeatherDominatorError:
     
     def test_raise_base_exception(self):
         """Test raising base exception"""
-        with pytest.raises(WeatherDominatorError) as exc_info:
+        with pytest.raises(WeatherDominatorError, match="Test error"):
             raise WeatherDominatorError("Test error")
-        
-        assert "Test error" in str(exc_info.value)
     
     def test_exception_with_cause(self):
         """Test exception with cause"""
@@ -60,78 +55,24 @@ class TestWeatherDominatorError:
         assert exc_info.value.__cause__ is original
 
 
-class TestConfigurationError:
-    """Test ConfigurationError class"""
+@pytest.mark.parametrize("exc_cls", SUBCLASSES)
+class TestSubclassErrors:
+    """Test construction and raising of each error family"""
     
-    def test_create_configuration_error(self):
-        """Test creating configuration error"""
-        error = ConfigurationError("Config not found")
-        assert str(error) == "Config not found"
+    def test_create(self, exc_cls):
+        """Test that the message survives str()"""
+        error = exc_cls("Something went wrong")
+        assert str(error) == "Something went wrong"
     
-    def test_raise_configuration_error(self):
-        """Test raising configuration error"""
-        with pytest.raises(ConfigurationError) as exc_info:
-            raise ConfigurationError("Invalid configuration")
-        
-        assert "Invalid configuration" in str(exc_info.value)
+    def test_raise(self, exc_cls):
+        """Test raising and catching the specific type"""
+        with pytest.raises(exc_cls, match="Something went wrong"):
+            raise exc_cls("Something went wrong")
     
-    def test_catch_as_base_exception(self):
+    def test_catch_as_base(self, exc_cls, _base=WeatherDominatorError):
         """Test catching as base exception"""
-        with pytest.raises(WeatherDominatorError):
-            raise ConfigurationError("Config error")
-
-
-class TestAPIError:
-    """Test APIError class"""
-    
-    def test_create_api_error(self):
-        """Test creating API error"""
-        error = APIError("API request failed")
-        assert str(error) == "API request failed"
-    
-    def test_raise_api_error(self):
-        """Test raising API error"""
-        with pytest.raises(APIError) as exc_info:
-            raise APIError("Network timeout")
-        
-        assert "Network timeout" in str(exc_info.value)
-    
-    def test_api_error_with_status_code(self):
-        """Test API error with additional context"""
-        error = APIError("HTTP 404: Not Found")
-        assert "404" in str(error)
-
-
-class TestDatabaseError:
-    """Test DatabaseError class"""
-    
-    def test_create_database_error(self):
-        """Test creating database error"""
-        error = DatabaseError("Connection failed")
-        assert str(error) == "Connection failed"
-    
-    def test_raise_database_error(self):
-        """Test raising database error"""
-        with pytest.raises(DatabaseError) as exc_info:
-            raise DatabaseError("Table does not exist")
-        
-        assert "Table does not exist" in str(exc_info.value)
-
-
-class TestValidationError:
-    """Test ValidationError class"""
-    
-    def test_create_validation_error(self):
-        """Test creating validation error"""
-        error = ValidationError("Invalid input")
-        assert str(error) == "Invalid input"
-    
-    def test_raise_validation_error(self):
-        """Test raising validation error"""
-        with pytest.raises(ValidationError) as exc_info:
-            raise ValidationError("Field is required")
-        
-        assert "Field is required" in str(exc_info.value)
+        with pytest.raises(_base):
+            raise exc_cls("Something went wrong")
 
 
 class TestHandleError:
@@ -161,19 +102,10 @@ class TestHandleError:
             assert isinstance(result, str)
             assert len(result) > 0
     
-    def test_handle_error_with_context(self):
-        """Test handle_error with additional context"""
-        if callable(handle_error):
-            error = APIError("Network timeout")
-            context = {"url": "https://api.example.com", "attempt": 3}
-            
-            # Assuming handle_error can accept context
-            try:
-                result = handle_error(error, "test_module", context=context)
-                assert result is None or isinstance(result, bool)
-            except TypeError:
-                # Function might not accept context parameter
-                pass
+    def test_handle_error_prefixes_generic_exceptions(self):
+        """Test that only non-application errors get the fallback prefix"""
+        assert handle_error(NetworkError("Timed out"), "Oops") == "Timed out"
+        assert handle_error(ValueError("bad"), "Oops") == "Oops: bad"
 
 
 class TestIsRecoverable:
@@ -183,36 +115,50 @@ class TestIsRecoverable:
         """Test that is_recoverable function exists"""
         assert callable(is_recoverable)
     
-    def test_api_error_recoverable(self):
-        """Test that API errors are typically recoverable"""
-        error = APIError("Network timeout")
-        # Implementation may vary - just test it doesn't crash
-        result = is_recoverable(error)
-        assert isinstance(result, bool)
-    
-    def test_database_error_recoverable(self):
-        """Test database error recoverability"""
-        error = DatabaseError("Connection lost")
-        result = is_recoverable(error)
-        assert isinstance(result, bool)
-    
-    def test_configuration_error_not_recoverable(self):
-        """Test that configuration errors are typically not recoverable"""
-        error = ConfigurationError("Missing required config")
-        result = is_recoverable(error)
-        assert isinstance(result, bool)
-    
-    def test_validation_error_not_recoverable(self):
-        """Test that validation errors are typically not recoverable"""
-        error = ValidationError("Invalid data format")
-        result = is_recoverable(error)
-        assert isinstance(result, bool)
-    
-    def test_generic_exception_handling(self):
-        """Test handling of generic exceptions"""
-        error = Exception("Generic error")
-        result = is_recoverable(error)
-        assert isinstance(result, bool)
+    @pytest.mark.parametrize("error,expected", [
+        (NetworkError("Connection reset"), True),
+        (RateLimitError("OpenWeatherMap", retry_after=30), True),
+        (CacheFullError(120.0, 100.0), True),
+        (DataNotFoundError("Weather", "Atlantis"), True),
+        (APIError("Network timeout"), False),
+        (DatabaseError("Connection lost"), False),
+        (ConfigurationError("Missing required config"), False),
+        (ValidationError("Invalid data format"), False),
+        (Exception("Generic error"), False),
+    ])
+    def test_is_recoverable(self, error, expected):
+        """Test the exact recoverability of each error type"""
+        assert is_recoverable(error) is expected
+
+
+class TestExceptionAttributes:
+    """Test attributes stored on specialised exceptions"""
+    
+    def test_rate_limit_attributes(self):
+        """Test that RateLimitError keeps its service and retry hint"""
+        error = RateLimitError("OpenWeatherMap", retry_after=30)
+        assert error.service == "OpenWeatherMap"
+        assert error.retry_after == 30
+        assert error.message == "Rate limit exceeded for OpenWeatherMap. Retry after 30 seconds"
+        assert error.details is None
+    
+    @pytest.mark.parametrize("copier", [
+        copy.copy,
+        lambda error: pickle.loads(pickle.dumps(error)),
+    ])
+    def test_round_trip_keeps_attributes(self, copier):
+        """Test that copying or pickling keeps fields and message text"""
+        for error in (APIKeyMissingError("openweather"),
+                      RateLimitError("svc", retry_after=5),
+                      CacheFullError(120.0, 100.0)):
+            clone = copier(error)
+            assert type(clone) is type(error)
+            assert str(clone) == str(error)
+            assert clone.message == error.message
+            assert clone.details == error.details
+        
+        clone = copier(APIKeyMissingError("openweather"))
+        assert clone.service == "openweather"
 
 
 class TestExceptionMessages:
@@ -287,14 +233,8 @@ class TestExceptionInheritance:
         with pytest.raises(WeatherDominatorError):
             raise APIError("API error")
     
-    def test_catch_multiple_types(self):
-        """Test catching multiple exception types"""
-        exceptions = [
-            ConfigurationError("Config"),
-            APIError("API"),
-            DatabaseError("DB")
-        ]
-        
-        for exc in exceptions:
-            with pytest.raises(WeatherDominatorError):
-                raise exc
+    @pytest.mark.parametrize("cls", SUBCLASSES)
+    def test_catch_multiple_types(self, cls, _base=WeatherDominatorError):
+        """Test catching each exception type via the base"""
+        with pytest.raises(_base):
+            raise cls("x")
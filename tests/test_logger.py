@@ -2,11 +2,14 @@
 Tests for src.logger module
 """
 import logging
-import os
+import operator
+from logging import Logger
 
 import pytest
 
-from src.logger import get_logger, log_function_call, setup_logging
+from src.logger import (ColoredFormatter, FastRotatingFileHandler,
+                        WeatherDominatorLogger, get_logger, log_function_call,
+                        setup_logging)
 
 
 class TestGetLogger:
@@ -15,7 +18,7 @@ class TestGetLogger:
     def test_get_logger_returns_logger(self):
         """Test that get_logger returns a Logger instance"""
         logger = get_logger("test_module")
-        assert isinstance(logger, logging.Logger)
+        assert isinstance(logger, Logger)
     
     def test_get_logger_with_name(self):
         """Test that logger has correct name"""
@@ -26,8 +29,12 @@ class TestGetLogger:
         """Test that multiple calls work correctly"""
         logger1 = get_logger("module1")
         logger2 = get_logger("module2")
-        assert isinstance(logger1, logging.Logger)
-        assert isinstance(logger2, logging.Logger)
+        assert isinstance(logger1, Logger)
+        assert isinstance(logger2, Logger)
+    
+    def test_get_logger_same_name_returns_same_instance(self):
+        """Test that repeated lookups return the cached logger"""
+        assert get_logger("cached_module") is get_logger("cached_module")
 
 
 class TestSetupLogging:
@@ -37,13 +44,11 @@ class TestSetupLogging:
         """Test that setup_logging function exists"""
         assert callable(setup_logging)
     
-    def test_setup_logging_runs(self):
-        """Test that setup_logging runs without error"""
-        try:
-            setup_logging()
-            assert True
-        except Exception as e:
-            pytest.fail(f"setup_logging raised {e}")
+    def test_setup_logging_configures_app_logger(self, configure_logging):
+        """Test that the session logging setup installed handlers"""
+        assert configure_logging.name == "WeatherDominator"
+        assert configure_logging.handlers
+        assert get_logger() is configure_logging
 
 
 class TestLogFunctionCall:
@@ -53,60 +58,151 @@ class TestLogFunctionCall:
         """Test that log_function_call decorator exists"""
         assert callable(log_function_call)
     
-    def test_decorator_on_function(self):
-        """Test decorator on a simple function"""
+    @pytest.mark.parametrize("op,a,b,expected", [
+        (operator.add, 2, 3, 5),
+        (operator.mul, 4, 5, 20),
+        (operator.sub, 10, 3, 7),
+    ])
+    def test_decorator_passthrough(self, op, a, b, expected):
+        """Test that decorated functions return their result unchanged"""
         @log_function_call
-        def test_function(x, y):
-            return x + y
+        def compute(x, y):
+            return op(x, y)
         
-        result = test_function(2, 3)
-        assert result == 5
+        assert compute(a, b) == expected
     
-    def test_decorator_preserves_return_value(self):
-        """Test that decorator returns function result"""
-        @log_function_call
+    def test_decorator_skipped_when_debug_disabled(self):
+        """Test that functions are returned unwrapped unless DEBUG is on"""
+        app_logger = logging.getLogger("WeatherDominator")
+        original_level = app_logger.level
+        
         def compute(a, b):
             return a * b
         
-        result = compute(4, 5)
-        assert result == 20
+        try:
+            app_logger.setLevel(logging.INFO)
+            assert log_function_call(compute) is compute
+            
+            app_logger.setLevel(logging.DEBUG)
+            wrapped = log_function_call(compute)
+            assert wrapped is not compute
+            assert wrapped(4, 5) == 20
+            assert wrapped.__name__ == "compute"
+        finally:
+            app_logger.setLevel(original_level)
 
 
 class TestLoggerBasicOperations:
     """Test basic logger operations"""
     
-    def test_logger_info(self):
-        """Test logger info method"""
-        logger = get_logger("test_info")
-        try:
-            logger.info("Test message")
-            assert True
-        except Exception as e:
-            pytest.fail(f"Logger.info raised {e}")
-    
-    def test_logger_warning(self):
-        """Test logger warning method"""
-        logger = get_logger("test_warning")
-        try:
-            logger.warning("Test warning")
-            assert True
-        except Exception as e:
-            pytest.fail(f"Logger.warning raised {e}")
-    
-    def test_logger_error(self):
-        """Test logger error method"""
-        logger = get_logger("test_error")
-        try:
-            logger.error("Test error")
-            assert True
-        except Exception as e:
-            pytest.fail(f"Logger.error raised {e}")
-    
-    def test_logger_debug(self):
-        """Test logger debug method"""
-        logger = get_logger("test_debug")
+    @pytest.mark.parametrize("level", ["debug", "info", "warning", "error"])
+    def test_logger_level_methods(self, shared_logger, level):
+        """Test logger level methods"""
+        getattr(shared_logger, level)(f"Test {level}")
+
+
+class TestColoredFormatter:
+    """Test ColoredFormatter output"""
+    
+    def _record(self, level, msg="Test message"):
+        return logging.LogRecord("test", level, __file__, 1, msg, None, None)
+    
+    def test_known_level_is_colored(self):
+        """Test that standard levels get their color and icon"""
+        formatter = ColoredFormatter("%(levelname)s - %(message)s")
+        output = formatter.format(self._record(logging.WARNING))
+        assert output.startswith("\033[33m")
+        assert "WARNING" in output
+        assert output.endswith("Test message")
+    
+    def test_custom_level_is_left_plain(self):
+        """Test that non-standard levels are passed through unchanged"""
+        formatter = ColoredFormatter("%(levelname)s - %(message)s")
+        output = formatter.format(self._record(25))
+        assert output == "Level 25 - Test message"
+    
+    def test_record_levelname_is_restored(self):
+        """Test that formatting does not leak colors into the shared record"""
+        record = self._record(logging.ERROR)
+        ColoredFormatter("%(levelname)s - %(message)s").format(record)
+        assert record.levelname == "ERROR"
+
+
+class TestFastRotatingFileHandler:
+    """Test FastRotatingFileHandler rollover"""
+    
+    def test_rolls_over_once_limit_reached(self, tmp_path):
+        """Test that the file rotates after reaching maxBytes"""
+        log_path = tmp_path / "app.log"
+        handler = FastRotatingFileHandler(
+            log_path, maxBytes=64, backupCount=1, encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
         try:
-            logger.debug("Test debug")
-            assert True
-        except Exception as e:
-            pytest.fail(f"Logger.debug raised {e}")
+            for _ in range(10):
+                handler.emit(logging.LogRecord(
+                    "test", logging.INFO, __file__, 1, "x" * 20, None, None
+                ))
+        finally:
+            handler.close()
+        
+        assert (tmp_path / "app.log.1").exists()
+        assert log_path.stat().st_size < 64 + 21
+
+
+class TestQueuedLogging:
+    """Test background file logging through the queue listener"""
+    
+    def test_records_reach_file_after_shutdown(self, tmp_path):
+        """Test that queued records are flushed to disk on shutdown"""
+        wd_logger = WeatherDominatorLogger(
+            name="WeatherDominator.queue_test",
+            log_dir=str(tmp_path),
+            console_output=False,
+        )
+        wd_logger.get_logger().info("queued message")
+        wd_logger.shutdown()
+        
+        contents = (tmp_path / "weather_dominator.log").read_text(encoding="utf-8")
+        assert "queued message" in contents
+        for handler in wd_logger.get_logger().handlers:
+            handler.close()
+    
+    def test_shutdown_is_idempotent(self, tmp_path):
+        """Test that shutdown can be called more than once"""
+        wd_logger = WeatherDominatorLogger(
+            name="WeatherDominator.queue_idempotent",
+            log_dir=str(tmp_path),
+            console_output=False,
+        )
+        wd_logger.shutdown()
+        wd_logger.shutdown()
+        for handler in wd_logger.get_logger().handlers:
+            handler.close()
+    
+    def test_replacing_logger_stops_previous_listener(self, tmp_path):
+        """Test that a second logger on the same name retires the first"""
+        first = WeatherDominatorLogger(
+            name="WeatherDominator.queue_replace",
+            log_dir=str(tmp_path / "first"),
+            console_output=False,
+        )
+        first_listener = first._listener
+        first_handlers = first_listener.handlers
+        second = WeatherDominatorLogger(
+            name="WeatherDominator.queue_replace",
+            log_dir=str(tmp_path / "second"),
+            console_output=False,
+        )
+        
+        assert first._listener is None
+        assert first_listener._thread is None
+        assert all(handler.stream is None for handler in first_handlers)
+        assert second.get_logger().handlers == [second._queue_handler]
+        
+        second.get_logger().info("replacement message")
+        second.shutdown()
+        contents = (tmp_path / "second" / "weather_dominator.log").read_text(encoding="utf-8")
+        assert "replacement message" in contents
+        for handler in second.get_logger().handlers:
+            handler.close()
@@ -3,79 +3,98 @@ Glassmorphic Style Configuration for Weather Dominator
 Contains color schemes, fonts, and styling constants
 """
 
-from src.constants import ThemeColors, FontConfig
+from dataclasses import dataclass
 
+from src.constants import (DATACLASS_OPTIONS, CobraThemeColors, FontConfig,
+                           ThemeColors)
 
+
+def _with_central_constants(cls):
+    """Add every ThemeColors color and FontConfig named font to cls as a field.
+
+    Fields already annotated in the class body take precedence.
+    """
+    fonts = {f"{name.upper()}_FONT": font for name, font in FontConfig.NAMED_FONTS.items()}
+    annotations = cls.__dict__.get("__annotations__", {})
+    copied = {}
+    for source in (ThemeColors._asdict(), fonts):
+        for name, value in source.items():
+            if name not in annotations:
+                copied[name] = type(value)
+                setattr(cls, name, value)
+    cls.__annotations__ = {**copied, **annotations}
+    return cls
+
+
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
+@_with_central_constants
 class GlassmorphicTheme:
-    """Configuration class for glassmorphic styling"""
-
-    # Background colors - using centralized constants
-    WINDOW_BG = ThemeColors.WINDOW_BG
-    CONTAINER_BG = ThemeColors.CONTAINER_BG
-    GLASS_BG = ThemeColors.GLASS_BG
-    CONTENT_BG = ThemeColors.CONTENT_BG
-
-    # Accent colors
-    PRIMARY_ACCENT = ThemeColors.PRIMARY_ACCENT
-    SECONDARY_ACCENT = ThemeColors.SECONDARY_ACCENT
-    HIGHLIGHT = ThemeColors.HIGHLIGHT
-    BORDER = ThemeColors.BORDER
-
-    # Gradient colors for glassmorphic effect
-    GRADIENT_COLORS = ThemeColors.GRADIENT_COLORS
-
-    # Text colors
-    TITLE_COLOR = ThemeColors.TITLE_COLOR
-    SUBTITLE_COLOR = ThemeColors.SUBTITLE_COLOR
-    TEXT_COLOR = ThemeColors.TEXT_COLOR
-    MUTED_TEXT = ThemeColors.MUTED_TEXT
-
-    # Button colors
-    BUTTON_BG = ThemeColors.BUTTON_BG
-    BUTTON_FG = ThemeColors.BUTTON_FG
-    BUTTON_ACTIVE_BG = ThemeColors.BUTTON_ACTIVE_BG
-    BUTTON_HOVER_BG = ThemeColors.BUTTON_HOVER_BG
-
-    # Danger/Close button
-    DANGER_COLOR = ThemeColors.DANGER_COLOR
-
-    # Fonts - using centralized font configuration
-    TITLE_FONT = FontConfig.TITLE_FONT
-    SUBTITLE_FONT = FontConfig.SUBTITLE_FONT
-    BODY_FONT = FontConfig.BODY_FONT
-    BUTTON_FONT = FontConfig.BUTTON_FONT
-    SECTION_FONT = FontConfig.SECTION_FONT
-    LABEL_FONT = FontConfig.LABEL_FONT
-    SMALL_FONT = FontConfig.SMALL_FONT
-    LARGE_FONT = FontConfig.LARGE_FONT
-
-    # Input colors
-    INPUT_BG = ThemeColors.INPUT_BG
-    INPUT_FG = ThemeColors.INPUT_FG
-    INPUT_BORDER = ThemeColors.INPUT_BORDER
+    """Configuration class for glassmorphic styling
+
+    An immutable settings object; use the shared THEME instance. Colors
+    (WINDOW_BG, PRIMARY_ACCENT, ...) and fonts (TITLE_FONT, ...) are added
+    as fields from src.constants by _with_central_constants.
+    """
 
     # Window properties
-    WINDOW_ALPHA = 0.95
-    BORDER_WIDTH = 1
-    PADDING_LARGE = 20
-    PADDING_MEDIUM = 10
-    PADDING_SMALL = 5
+    WINDOW_ALPHA: float = 0.95
+    BORDER_WIDTH: int = 1
+    PADDING_LARGE: int = 20
+    PADDING_MEDIUM: int = 10
+    PADDING_SMALL: int = 5
 
     # Glass effect properties
-    GLASS_HIGHLIGHT_HEIGHT = 2
-    GRADIENT_FRAME_HEIGHT = 1
-    SEPARATOR_HEIGHT = 1
+    GLASS_HIGHLIGHT_HEIGHT: int = 2
+    GRADIENT_FRAME_HEIGHT: int = 1
+    SEPARATOR_HEIGHT: int = 1
 
 
 # COBRA themed color scheme (alternative)
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class CobraTheme(GlassmorphicTheme):
     """COBRA-specific color theme"""
 
     # COBRA signature colors
-    PRIMARY_ACCENT = "#dc143c"  # Crimson red
-    SECONDARY_ACCENT = "#ff6b6b"  # Light red
-    HIGHLIGHT = "#8b0000"  # Dark red
+    PRIMARY_ACCENT: str = CobraThemeColors.PRIMARY_ACCENT  # Crimson red
+    SECONDARY_ACCENT: str = CobraThemeColors.SECONDARY_ACCENT  # Light red
+    HIGHLIGHT: str = CobraThemeColors.HIGHLIGHT  # Dark red
 
     # Updated text colors for COBRA theme
-    TITLE_COLOR = "#dc143c"
-    SUBTITLE_COLOR = "#ff6b6b"
+    TITLE_COLOR: str = CobraThemeColors.TITLE_COLOR
+    SUBTITLE_COLOR: str = CobraThemeColors.SUBTITLE_COLOR
+
+
+# Shared default theme instance
+THEME = GlassmorphicTheme()
+
+# Tk widget class given to glass panel frames, scoping the option defaults below
+GLASS_PANEL_CLASS = "GlassPanel"
+
+
+def apply_widget_defaults(widget, theme: GlassmorphicTheme) -> None:
+    """Register a theme's widget defaults in the Tk option database.
+
+    Labels, frames, entries and buttons created inside a GLASS_PANEL_CLASS
+    frame take these values unless given explicitly, so panel builders only
+    pass the options that differ. The database is per Tk interpreter and
+    the most recently applied theme wins.
+
+    Args:
+        widget: Any widget of the target Tk interpreter
+        theme: Theme supplying the colors
+    """
+    defaults = (
+        ("Frame.background", theme.GLASS_BG),
+        ("Label.background", theme.GLASS_BG),
+        ("Label.foreground", theme.TEXT_COLOR),
+        ("Label.font", theme.SMALL_FONT),
+        ("Entry.background", theme.INPUT_BG),
+        ("Entry.foreground", theme.INPUT_FG),
+        ("Entry.relief", "solid"),
+        ("Entry.borderWidth", 1),
+        ("Button.foreground", "white"),
+        ("Button.relief", "flat"),
+        ("Button.borderWidth", 0),
+    )
+    for pattern, value in defaults:
+        widget.option_add(f"*{GLASS_PANEL_CLASS}*{pattern}", value)
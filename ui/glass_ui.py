@@ -4,34 +4,28 @@ Implement glassmorphic panels for weather display, Cobra intelligence, and alert
 Create a widget factory for consistent glass-styled components.
 """
 
+import functools
+import logging
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, messagebox, filedialog
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import io
+from datetime import datetime
 
-# Try to import PIL, but provide fallbacks if not available
+from src.constants import CobraThemeColors
+from theme_config import GLASS_PANEL_CLASS, apply_widget_defaults
+
+# Optional PIL support; callers must check PIL_AVAILABLE before use
 try:
     from PIL import Image, ImageTk # type: ignore
     PIL_AVAILABLE = True
 except ImportError:
-    print("⚠️ PIL (Pillow) not available. Image features will be disabled.")
+    logging.getLogger(__name__).warning(
+        "PIL (Pillow) not available. Image features will be disabled."
+    )
     PIL_AVAILABLE = False
-    # Create fallback classes
-    class MockImage:
-        @staticmethod
-        def open(*args, **kwargs):
-            return None
-        @staticmethod
-        def new(*args, **kwargs):
-            return None
-    
-    class MockImageTk:
-        @staticmethod
-        def PhotoImage(*args, **kwargs):
-            return None
-    
-    Image = MockImage()
-    ImageTk = MockImageTk()
+    Image = ImageTk = None
 
 # Import Interactive Features
 try:
@@ -42,104 +36,283 @@ except ImportError:
     INTERACTIVE_AVAILABLE = False
     InteractiveFeatures = None
 
+# Cobra panel accents
+_COBRA_RED = CobraThemeColors.PRIMARY_ACCENT
+_COBRA_RED_ACTIVE = "#b8001a"
+
+# Theme whose widget defaults are in each Tcl interpreter's option database
+_WIDGET_DEFAULTS_THEME: Dict[Any, Any] = {}
+
+# Named fonts shared across panels, keyed by (Tcl interpreter, font spec)
+_FONT_CACHE: Dict[Tuple[Any, tuple], tkfont.Font] = {}
+
+# OpenWeatherMap icon code -> display emoji
+_WEATHER_ICONS = {
+    '01d': '☀️', '01n': '🌙', '02d': '⛅', '02n': '☁️',
+    '03d': '☁️', '03n': '☁️', '04d': '☁️', '04n': '☁️',
+    '09d': '🌦️', '09n': '🌧️', '10d': '🌦️', '10n': '🌧️',
+    '11d': '⛈️', '11n': '⛈️', '13d': '❄️', '13n': '❄️',
+    '50d': '🌫️', '50n': '🌫️'
+}
+
+# Affiliation substring -> (portrait icon, security level), first match wins
+_AFFILIATION_RULES = (
+    ('cobra', "🐍", "🔒 Security Level: COBRA EYES ONLY"),
+    ('joe', "🪖", "🔒 Security Level: CLASSIFIED"),
+)
+_RESTRICTED_SECURITY = "🔒 Security Level: RESTRICTED"
+
+# Weather label texts; placeholders shown when a reading is missing
+_HUMIDITY_NA = "Humidity: --"
+_WIND_NA = "Wind: --"
+_PRESSURE_NA = "Pressure: --"
+_TEMP_TEXT = "{temp}°F"
+_HUMIDITY_TEXT = "💧 Humidity: {humidity}%"
+_WIND_TEXT = "💨 Wind: {wind_speed} mph | Feels like: {feels_like}°F"
+_PRESSURE_TEXT = "📊 Pressure: {pressure} hPa | Visibility: {visibility} km"
+_SUN_TIMES_TEXT = "☀️ Sunrise: {sunrise} | 🌅 Sunset: {sunset}"
+_UPDATED_TEXT = "Last Intel: {timestamp}"
+
+
+class _Readings(dict):
+    """Weather data mapping that formats missing readings as '--'"""
+    
+    def __missing__(self, key):
+        return '--'
+
+
+@functools.lru_cache(maxsize=128)
+def _display_name(name: str) -> str:
+    """Return the upper-cased dossier name, cached for repeat lookups"""
+    return name.upper()
+
+
+@functools.lru_cache(maxsize=128)
+def _affiliation_style(affiliation: str) -> Optional[Tuple[str, str]]:
+    """Return the (icon, security level) of the first matching affiliation rule"""
+    lowered = affiliation.lower()
+    for needle, icon, security in _AFFILIATION_RULES:
+        if needle in lowered:
+            return icon, security
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _glass_frame_opts(bg: str, border: str) -> Dict[str, Any]:
+    """Return the shared glassmorphic frame options for a background/border pair"""
+    return {
+        'class_': GLASS_PANEL_CLASS,
+        'bg': bg,
+        'relief': 'raised',
+        'bd': 1,
+        'highlightbackground': border,
+        'highlightcolor': border,
+        'highlightthickness': 1,
+    }
+
+
 class GlassPanel(tk.Frame):
     """Base class for glassmorphic panels"""
     
+    # Name of the method that builds the panel body. When set, building is
+    # deferred until the panel is first shown or one of its widgets is used.
+    _lazy_builder: Optional[str] = None
+    
     def __init__(self, parent, theme, title: str = "", **kwargs):
-        super().__init__(parent, bg=theme.GLASS_BG, relief='raised', bd=1, **kwargs)
+        super().__init__(parent, **_glass_frame_opts(theme.GLASS_BG, theme.BORDER), **kwargs)
         self.theme = theme
+        if _WIDGET_DEFAULTS_THEME.get(self.tk) != theme:
+            apply_widget_defaults(self, theme)
+            _WIDGET_DEFAULTS_THEME[self.tk] = theme
         self.title = title
         
-        # Add glassmorphic styling
-        self.config(
-            highlightbackground=theme.BORDER,
-            highlightcolor=theme.BORDER,
-            highlightthickness=1
-        )
+        # Last options applied through _batch_config, per widget
+        self._applied: Dict[tk.Widget, Dict[str, Any]] = {}
+        
+        # Latest (update method, data) not yet drawn; drawn when the panel
+        # is built or, once built, on the next idle turn
+        self._pending_update = None
+        self._flush_scheduled = False
+        self._built = self._lazy_builder is None
+        if not self._built:
+            self._map_binding = self.bind('<Map>', self._ensure_built, add='+')
         
         if title:
             self.create_title_section()
     
+    def __getattr__(self, name):
+        """Build a lazy panel's widgets the first time one is accessed"""
+        if name.startswith('_') or self.__dict__.get('_built', True):
+            raise AttributeError(name)
+        self._ensure_built()
+        return getattr(self, name)
+    
+    def _ensure_built(self, event=None):
+        """Run the deferred body builder once and replay any pending update"""
+        if self._built:
+            return
+        self._built = True
+        self.unbind('<Map>', self._map_binding)
+        
+        # Hold size propagation while the body is packed so the parent is
+        # re-laid out once for the whole panel rather than per child
+        self.pack_propagate(False)
+        try:
+            getattr(self, self._lazy_builder)()
+        finally:
+            self.pack_propagate(True)
+        
+        self._flush_pending_update()
+    
+    def _queue_update(self, update, data):
+        """Queue data for display, keeping only the latest per idle turn
+        
+        Args:
+            update: Method that draws the data
+            data: Payload passed to update
+        """
+        self._pending_update = (update, data)
+        if self._built and not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_pending_update)
+    
+    def _flush_pending_update(self):
+        """Draw the most recently queued update, if any"""
+        self._flush_scheduled = False
+        if self._pending_update is not None:
+            update, data = self._pending_update
+            self._pending_update = None
+            update(data)
+    
+    def _batch_config(self, updates):
+        """Apply a set of widget option changes in a single pass
+        
+        Each widget gets one configure() call carrying only the options
+        whose value differs from what was last applied, so a refresh with
+        unchanged data makes no Tk calls. Panel widgets must therefore be
+        updated through this method (see set_status) rather than directly.
+        
+        Args:
+            updates: Iterable of (widget, options dict) pairs
+        """
+        for widget, options in updates:
+            last = self._applied.setdefault(widget, {})
+            changed = {
+                key: value for key, value in options.items()
+                if key not in last or last[key] != value
+            }
+            if changed:
+                widget.configure(**changed)
+                last.update(changed)
+    
+    def set_status(self, widget, text: str):
+        """Show a transient status message (e.g. loading) on a panel widget
+        
+        Args:
+            widget: Label owned by this panel
+            text: Message to display
+        """
+        self._batch_config(((widget, {'text': text}),))
+    
+    def _font(self, spec):
+        """Return a shared named Tk font for a (family, size[, style]) tuple
+        
+        Widgets given a named font skip re-parsing the font description,
+        and every panel in the application shares one font per spec.
+        
+        Args:
+            spec: Font description tuple, e.g. theme.BODY_FONT
+            
+        Returns:
+            tkinter.font.Font instance
+        """
+        key = (self.tk, spec)
+        font = _FONT_CACHE.get(key)
+        if font is None:
+            font = _FONT_CACHE[key] = tkfont.Font(root=self, font=spec)
+        return font
+    
     def create_title_section(self):
         """Create title section for the panel"""
-        title_frame = tk.Frame(self, bg=self.theme.GLASS_BG)
-        title_frame.pack(fill='x', pady=(10, 5))
-        
+        # Packed straight into the panel; a wrapper frame would only add a widget
         title_label = tk.Label(
-            title_frame,
+            self,
             text=self.title,
-            font=self.theme.SECTION_FONT,
+            font=self._font(self.theme.SECTION_FONT),
             fg=self.theme.PRIMARY_ACCENT,
             bg=self.theme.GLASS_BG
         )
-        title_label.pack()
+        title_label.pack(pady=(10, 0))
         
         # Separator
         separator = tk.Frame(
-            title_frame,
+            self,
             bg=self.theme.HIGHLIGHT,
             height=1
         )
-        separator.pack(fill='x', pady=(5, 0), padx=20)
+        separator.pack(fill='x', pady=(5, 5), padx=20)
 
 class WeatherDisplayPanel(GlassPanel):
     """Glassmorphic panel for weather data display"""
     
-    def __init__(self, parent, theme):
+    _lazy_builder = 'create_weather_widgets'
+    
+    # Widget references live in slots; tk.Frame still provides __dict__
+    __slots__ = (
+        'on_fetch', 'city_entry', 'fetch_button', 'icon_label', 'temp_label',
+        'desc_label', 'humidity_label', 'wind_label', 'pressure_label',
+        'sun_times_label', 'updated_label',
+    )
+    
+    def __init__(self, parent, theme, on_fetch=None):
         super().__init__(parent, theme, "⛈️ WEATHER INTELLIGENCE")
-        self.create_weather_widgets()
+        self.on_fetch = on_fetch
     
     def create_weather_widgets(self):
         """Create weather-specific widgets"""
+        # Colors and borders not passed here come from apply_widget_defaults
+        theme = self.theme
+        
         # Input section
-        input_frame = tk.Frame(self, bg=self.theme.GLASS_BG)
+        input_frame = tk.Frame(self)
         input_frame.pack(fill='x', padx=15, pady=10)
         
         tk.Label(
             input_frame,
             text="Target Location:",
-            font=self.theme.LABEL_FONT,
-            fg=self.theme.TEXT_COLOR,
-            bg=self.theme.GLASS_BG
+            font=self._font(theme.LABEL_FONT)
         ).pack(anchor='w')        
         self.city_entry = tk.Entry(
             input_frame,
-            font=self.theme.BODY_FONT,
-            bg=self.theme.INPUT_BG,
-            fg=self.theme.INPUT_FG,
-            insertbackground=self.theme.INPUT_FG,
-            relief='solid',
-            bd=1,
+            font=self._font(theme.BODY_FONT),
+            insertbackground=theme.INPUT_FG,
             highlightthickness=1,
-            highlightcolor=self.theme.INPUT_BORDER,
-            highlightbackground=self.theme.INPUT_BORDER
+            highlightcolor=theme.INPUT_BORDER,
+            highlightbackground=theme.INPUT_BORDER
         )
         self.city_entry.pack(fill='x', pady=(5, 10))
         
         self.fetch_button = tk.Button(
             input_frame,
             text="🌍 ACQUIRE WEATHER DATA",
-            font=self.theme.BUTTON_FONT,
-            bg=self.theme.PRIMARY_ACCENT,
-            fg='white',
-            activebackground=self.theme.SECONDARY_ACCENT,
-            relief='flat',
-            bd=0,
-            pady=8
+            font=self._font(theme.BUTTON_FONT),
+            bg=theme.PRIMARY_ACCENT,
+            activebackground=theme.SECONDARY_ACCENT,
+            pady=8,
+            command=self.on_fetch
         )
         self.fetch_button.pack(fill='x')
         
         # Display section
-        display_frame = tk.Frame(self, bg=self.theme.GLASS_BG)
+        display_frame = tk.Frame(self)
         display_frame.pack(fill='both', expand=True, padx=15, pady=10)
         
         # Weather icon placeholder
         self.icon_label = tk.Label(
             display_frame,
             text="🌤️",
-            font=('Arial', 32),
-            bg=self.theme.GLASS_BG,
-            fg=self.theme.PRIMARY_ACCENT
+            font=self._font(('Arial', 32)),
+            fg=theme.PRIMARY_ACCENT
         )
         self.icon_label.pack(pady=(0, 10))
         
@@ -147,9 +320,7 @@ class WeatherDisplayPanel(GlassPanel):
         self.temp_label = tk.Label(
             display_frame,
             text="-- °F",
-            font=self.theme.LARGE_FONT,
-            fg=self.theme.TEXT_COLOR,
-            bg=self.theme.GLASS_BG
+            font=self._font(theme.LARGE_FONT)
         )
         self.temp_label.pack()
         
@@ -157,67 +328,53 @@ class WeatherDisplayPanel(GlassPanel):
         self.desc_label = tk.Label(
             display_frame,
             text="Awaiting target coordinates...",
-            font=self.theme.BODY_FONT,
-            fg=self.theme.SUBTITLE_COLOR,
-            bg=self.theme.GLASS_BG,
+            font=self._font(theme.BODY_FONT),
+            fg=theme.SUBTITLE_COLOR,
             wraplength=200
         )
         self.desc_label.pack(pady=5)
         
         # Additional info frame
-        info_frame = tk.Frame(display_frame, bg=self.theme.GLASS_BG)
+        info_frame = tk.Frame(display_frame)
         info_frame.pack(fill='x', pady=10)
         
         # Humidity
         self.humidity_label = tk.Label(
             info_frame,
-            text="Humidity: --",
-            font=self.theme.SMALL_FONT,
-            fg=self.theme.TEXT_COLOR,
-            bg=self.theme.GLASS_BG
+            text="Humidity: --"
         )
         self.humidity_label.pack(anchor='w')
         
         # Wind
         self.wind_label = tk.Label(
             info_frame,
-            text="Wind: --",
-            font=self.theme.SMALL_FONT,
-            fg=self.theme.TEXT_COLOR,
-            bg=self.theme.GLASS_BG
+            text="Wind: --"
         )
         self.wind_label.pack(anchor='w')
         
         # Pressure
         self.pressure_label = tk.Label(
             info_frame,
-            text="Pressure: --",
-            font=self.theme.SMALL_FONT,
-            fg=self.theme.TEXT_COLOR,
-            bg=self.theme.GLASS_BG
+            text="Pressure: --"
         )
         self.pressure_label.pack(anchor='w')
         
         # Forecast section
-        forecast_frame = tk.Frame(display_frame, bg=self.theme.GLASS_BG)
+        forecast_frame = tk.Frame(display_frame)
         forecast_frame.pack(fill='x', pady=(15, 0))
         
         forecast_title = tk.Label(
             forecast_frame,
             text="📊 TACTICAL FORECAST",
-            font=self.theme.LABEL_FONT,
-            fg=self.theme.PRIMARY_ACCENT,
-            bg=self.theme.GLASS_BG
+            font=self._font(theme.LABEL_FONT),
+            fg=theme.PRIMARY_ACCENT
         )
         forecast_title.pack()
         
         # Sun times
         self.sun_times_label = tk.Label(
             forecast_frame,
-            text="☀️ Sunrise: -- | 🌅 Sunset: --",
-            font=self.theme.SMALL_FONT,
-            fg=self.theme.TEXT_COLOR,
-            bg=self.theme.GLASS_BG
+            text="☀️ Sunrise: -- | 🌅 Sunset: --"
         )
         self.sun_times_label.pack(pady=(5, 0))
         
@@ -225,123 +382,116 @@ class WeatherDisplayPanel(GlassPanel):
         self.updated_label = tk.Label(
             forecast_frame,
             text="Last Intel: --",
-            font=('Arial', 8),
-            fg=self.theme.MUTED_TEXT,
-            bg=self.theme.GLASS_BG
+            font=self._font(('Arial', 8)),
+            fg=theme.MUTED_TEXT
         )
         self.updated_label.pack(pady=(5, 0))
     
     def update_weather_data(self, data: Dict[str, Any]):
-        """Update the weather display with new data"""
+        """Update the weather display with new data
+        
+        Calls made within one event-loop turn are coalesced; only the
+        latest data is drawn when Tk next goes idle.
+        """
+        self._queue_update(self._draw_weather_data, data)
+    
+    def _draw_weather_data(self, data: Dict[str, Any]):
+        """Apply weather data to the display labels"""
         if "error" in data:
-            self.temp_label.config(text="ERROR", fg=self.theme.DANGER_COLOR)
-            self.desc_label.config(text=data["error"])
-            self.humidity_label.config(text="Humidity: --")
-            self.wind_label.config(text="Wind: --")
-            self.pressure_label.config(text="Pressure: --")
-            self.icon_label.config(text="⚠️")
+            self._batch_config((
+                (self.temp_label, {'text': "ERROR", 'fg': self.theme.DANGER_COLOR}),
+                (self.desc_label, {'text': data["error"]}),
+                (self.humidity_label, {'text': _HUMIDITY_NA}),
+                (self.wind_label, {'text': _WIND_NA}),
+                (self.pressure_label, {'text': _PRESSURE_NA}),
+                (self.icon_label, {'text': "⚠️"}),
+            ))
             return
         
-        # Update temperature with city name
-        temp = data.get('temp', '--')
-        city = data.get('city', 'Unknown')
-        country = data.get('country', '')
+        readings = _Readings(data)
+        get = data.get
+        
+        # Description with city name
+        city = get('city', 'Unknown')
+        country = get('country', '')
         location = f"{city}, {country}" if country else city
-        self.temp_label.config(text=f"{temp}°F", fg=self.theme.TEXT_COLOR)
-        
-        # Update description with location
-        desc = data.get('description', 'Unknown conditions')
-        self.desc_label.config(text=f"{desc}\n{location}")
-        
-        # Update additional info with more details
-        humidity = data.get('humidity', '--')
-        self.humidity_label.config(text=f"💧 Humidity: {humidity}%")
-        
-        wind_speed = data.get('wind_speed', '--')
-        feels_like = data.get('feels_like', '--')
-        self.wind_label.config(text=f"💨 Wind: {wind_speed} mph | Feels like: {feels_like}°F")
-        
-        pressure = data.get('pressure', '--')
-        visibility = data.get('visibility', '--')
-        self.pressure_label.config(text=f"📊 Pressure: {pressure} hPa | Visibility: {visibility} km")
-          # Update weather icon based on condition
-        icon_code = data.get('icon', '')
-        weather_icons = {
-            '01d': '☀️', '01n': '🌙', '02d': '⛅', '02n': '☁️',
-            '03d': '☁️', '03n': '☁️', '04d': '☁️', '04n': '☁️',
-            '09d': '🌦️', '09n': '🌧️', '10d': '🌦️', '10n': '🌧️',
-            '11d': '⛈️', '11n': '⛈️', '13d': '❄️', '13n': '❄️',
-            '50d': '🌫️', '50n': '🌫️'
-        }
-        icon = weather_icons.get(icon_code, '🌤️')
-        self.icon_label.config(text=icon)
-        
-        # Update sun times if available
-        sunrise = data.get('sunrise', '--')
-        sunset = data.get('sunset', '--')
-        self.sun_times_label.config(text=f"☀️ Sunrise: {sunrise} | 🌅 Sunset: {sunset}")
-          # Update timestamp
-        timestamp = data.get('timestamp', '--')
-        self.updated_label.config(text=f"Last Intel: {timestamp}")
+        desc = get('description', 'Unknown conditions')
+        
+        # Weather icon based on condition
+        icon = _WEATHER_ICONS.get(get('icon', ''), '🌤️')
+        
+        self._batch_config((
+            (self.temp_label, {'text': _TEMP_TEXT.format_map(readings), 'fg': self.theme.TEXT_COLOR}),
+            (self.desc_label, {'text': f"{desc}\n{location}"}),
+            (self.humidity_label, {'text': _HUMIDITY_TEXT.format_map(readings)}),
+            (self.wind_label, {'text': _WIND_TEXT.format_map(readings)}),
+            (self.pressure_label, {'text': _PRESSURE_TEXT.format_map(readings)}),
+            (self.icon_label, {'text': icon}),
+            (self.sun_times_label, {'text': _SUN_TIMES_TEXT.format_map(readings)}),
+            (self.updated_label, {'text': _UPDATED_TEXT.format_map(readings)}),
+        ))
 
 class CobraIntelPanel(GlassPanel):
     """Glassmorphic panel for Cobra intelligence data"""
     
-    def __init__(self, parent, theme):
+    _lazy_builder = 'create_cobra_widgets'
+    
+    # Widget references live in slots; tk.Frame still provides __dict__
+    __slots__ = (
+        'on_search', 'character_entry', 'search_button', 'char_image_label',
+        'char_name_label', 'char_bio_label', 'char_affiliation_label',
+        'security_label', 'db_status_label', 'last_op_label',
+    )
+    
+    def __init__(self, parent, theme, on_search=None):
         super().__init__(parent, theme, "🐍 COBRA INTELLIGENCE")
-        self.create_cobra_widgets()
+        self.on_search = on_search
     
     def create_cobra_widgets(self):
         """Create Cobra intelligence widgets"""
+        # Colors and borders not passed here come from apply_widget_defaults
+        theme = self.theme
+        
         # Search section
-        search_frame = tk.Frame(self, bg=self.theme.GLASS_BG)
+        search_frame = tk.Frame(self)
         search_frame.pack(fill='x', padx=15, pady=10)
         
         tk.Label(
             search_frame,
             text="Target Subject:",
-            font=self.theme.LABEL_FONT,
-            fg=self.theme.TEXT_COLOR,
-            bg=self.theme.GLASS_BG
+            font=self._font(theme.LABEL_FONT)
         ).pack(anchor='w')        
         self.character_entry = tk.Entry(
             search_frame,
-            font=self.theme.BODY_FONT,
-            bg=self.theme.INPUT_BG,
-            fg=self.theme.INPUT_FG,
-            insertbackground=self.theme.INPUT_FG,
-            relief='solid',
-            bd=1,
+            font=self._font(theme.BODY_FONT),
+            insertbackground=theme.INPUT_FG,
             highlightthickness=1,
-            highlightcolor=self.theme.INPUT_BORDER,
-            highlightbackground=self.theme.INPUT_BORDER
+            highlightcolor=theme.INPUT_BORDER,
+            highlightbackground=theme.INPUT_BORDER
         )
         self.character_entry.pack(fill='x', pady=(5, 10))
         
         self.search_button = tk.Button(
             search_frame,
             text="🔍 INTERROGATE DATABASE",
-            font=self.theme.BUTTON_FONT,
-            bg="#dc143c",  # Cobra red
-            fg='white',
-            activebackground="#b8001a",
-            relief='flat',
-            bd=0,
-            pady=8
+            font=self._font(theme.BUTTON_FONT),
+            bg=_COBRA_RED,
+            activebackground=_COBRA_RED_ACTIVE,
+            pady=8,
+            command=self.on_search
         )
         self.search_button.pack(fill='x')
         
         # Character display section
-        display_frame = tk.Frame(self, bg=self.theme.GLASS_BG)
+        display_frame = tk.Frame(self)
         display_frame.pack(fill='both', expand=True, padx=15, pady=10)
         
         # Character image placeholder
         self.char_image_label = tk.Label(
             display_frame,
             text="👤",
-            font=('Arial', 32),
-            bg=self.theme.GLASS_BG,
-            fg="#dc143c"
+            font=self._font(('Arial', 32)),
+            fg=_COBRA_RED
         )
         self.char_image_label.pack(pady=(0, 10))
         
@@ -349,9 +499,8 @@ class CobraIntelPanel(GlassPanel):
         self.char_name_label = tk.Label(
             display_frame,
             text="UNKNOWN SUBJECT",
-            font=self.theme.SECTION_FONT,
-            fg="#dc143c",
-            bg=self.theme.GLASS_BG
+            font=self._font(theme.SECTION_FONT),
+            fg=_COBRA_RED
         )
         self.char_name_label.pack()
         
@@ -359,9 +508,6 @@ class CobraIntelPanel(GlassPanel):
         self.char_bio_label = tk.Label(
             display_frame,
             text="Intelligence files awaiting access...",
-            font=self.theme.SMALL_FONT,
-            fg=self.theme.TEXT_COLOR,
-            bg=self.theme.GLASS_BG,
             wraplength=200,
             justify='left'
         )
@@ -371,32 +517,26 @@ class CobraIntelPanel(GlassPanel):
         self.char_affiliation_label = tk.Label(
             display_frame,
             text="Affiliation: CLASSIFIED",
-            font=self.theme.SMALL_FONT,
-            fg=self.theme.SUBTITLE_COLOR,
-            bg=self.theme.GLASS_BG
+            fg=theme.SUBTITLE_COLOR
         )
         self.char_affiliation_label.pack(anchor='w')
         
         # Status section
-        status_frame = tk.Frame(display_frame, bg=self.theme.GLASS_BG)
+        status_frame = tk.Frame(display_frame)
         status_frame.pack(fill='x', pady=(15, 0))
         
         status_title = tk.Label(
             status_frame,
             text="📊 OPERATIONAL STATUS",
-            font=self.theme.LABEL_FONT,
-            fg="#dc143c",
-            bg=self.theme.GLASS_BG
+            font=self._font(theme.LABEL_FONT),
+            fg=_COBRA_RED
         )
         status_title.pack()
         
         # Database status
         self.db_status_label = tk.Label(
             status_frame,
-            text="🗃️ Database: ONLINE",
-            font=self.theme.SMALL_FONT,
-            fg=self.theme.TEXT_COLOR,
-            bg=self.theme.GLASS_BG
+            text="🗃️ Database: ONLINE"
         )
         self.db_status_label.pack(anchor='w', pady=(5, 0))
         
@@ -404,9 +544,7 @@ class CobraIntelPanel(GlassPanel):
         self.security_label = tk.Label(
             status_frame,
             text="🔒 Security Level: CLASSIFIED",
-            font=self.theme.SMALL_FONT,
-            fg="#dc143c",
-            bg=self.theme.GLASS_BG
+            fg=_COBRA_RED
         )
         self.security_label.pack(anchor='w')
         
@@ -414,62 +552,71 @@ class CobraIntelPanel(GlassPanel):
         self.last_op_label = tk.Label(
             status_frame,
             text="Last Operation: --",
-            font=('Arial', 8),
-            fg=self.theme.MUTED_TEXT,
-            bg=self.theme.GLASS_BG
+            font=self._font(('Arial', 8)),
+            fg=theme.MUTED_TEXT
         )
         self.last_op_label.pack(anchor='w', pady=(5, 0))
     
     def update_character_data(self, data: Dict[str, Any]):
-        """Update the character display with new data"""
+        """Update the character display with new data
+        
+        Calls made within one event-loop turn are coalesced; only the
+        latest data is drawn when Tk next goes idle.
+        """
+        self._queue_update(self._draw_character_data, data)
+    
+    def _draw_character_data(self, data: Dict[str, Any]):
+        """Apply character data to the dossier labels"""
         if "error" in data:
-            self.char_name_label.config(text="ACCESS DENIED", fg=self.theme.DANGER_COLOR)
-            self.char_bio_label.config(text=data["error"])
-            self.char_affiliation_label.config(text="Affiliation: UNKNOWN")
-            self.char_image_label.config(text="❌")
+            self._batch_config((
+                (self.char_name_label, {'text': "ACCESS DENIED", 'fg': self.theme.DANGER_COLOR}),
+                (self.char_bio_label, {'text': data["error"]}),
+                (self.char_affiliation_label, {'text': "Affiliation: UNKNOWN"}),
+                (self.char_image_label, {'text': "❌"}),
+            ))
             return
         
-        # Update character info
-        name = data.get('name', 'Unknown Subject')
-        self.char_name_label.config(text=name.upper(), fg="#dc143c")
+        # Character info, read through a bound lookup
+        get = data.get
+        name = get('name', 'Unknown Subject')
         
-        bio = data.get('biography', data.get('bio', 'No intelligence available.'))
-        if len(bio) > 150:
-            bio = bio[:150] + "..."
-        self.char_bio_label.config(text=bio)
+        bio = get('biography') or get('bio') or 'No intelligence available.'
         
-        affiliation = data.get('affiliation', data.get('team', 'Unknown'))
-        speciality = data.get('speciality', data.get('specialty', ''))
+        affiliation = get('affiliation') or get('team') or 'Unknown'
+        speciality = get('speciality') or get('specialty') or ''
         
         affiliation_text = f"🎖️ Team: {affiliation}"
         if speciality:
             affiliation_text += f"\n⚡ Specialty: {speciality}"
         
-        self.char_affiliation_label.config(text=affiliation_text)
-          # Update character image/icon based on affiliation
-        if 'cobra' in affiliation.lower():
-            self.char_image_label.config(text="🐍")
-        elif 'joe' in affiliation.lower() or 'gi joe' in affiliation.lower():
-            self.char_image_label.config(text="🪖")
-        elif 'villain' in str(data).lower():
-            self.char_image_label.config(text="😈")
+        # Character icon and security level based on affiliation; without a
+        # match, the displayed dossier fields (not the whole payload) are scanned
+        style = _affiliation_style(affiliation)
+        if style:
+            char_icon, security_text = style
         else:
-            self.char_image_label.config(text="👤")
+            is_villain = any(
+                'villain' in str(field).lower()
+                for field in (name, affiliation, speciality, bio)
+            )
+            char_icon = "😈" if is_villain else "👤"
+            security_text = _RESTRICTED_SECURITY
         
-        # Update status information
-        self.db_status_label.config(text="🗃️ Database: INTEL ACQUIRED")
+        if len(bio) > 150:
+            bio = f"{bio[:150]}..."
         
-        # Set security level based on affiliation
-        if 'cobra' in affiliation.lower():
-            self.security_label.config(text="🔒 Security Level: COBRA EYES ONLY")
-        elif 'joe' in affiliation.lower():
-            self.security_label.config(text="🔒 Security Level: CLASSIFIED")
-        else:
-            self.security_label.config(text="🔒 Security Level: RESTRICTED")
-          # Update last operation timestamp
-        from datetime import datetime
+        # Last operation timestamp
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.last_op_label.config(text=f"Last Operation: {timestamp}")
+        
+        self._batch_config((
+            (self.char_name_label, {'text': _display_name(name), 'fg': _COBRA_RED}),
+            (self.char_bio_label, {'text': bio}),
+            (self.char_affiliation_label, {'text': affiliation_text}),
+            (self.char_image_label, {'text': char_icon}),
+            (self.db_status_label, {'text': "🗃️ Database: INTEL ACQUIRED"}),
+            (self.security_label, {'text': security_text}),
+            (self.last_op_label, {'text': f"Last Operation: {timestamp}"}),
+        ))
 
 class InteractiveFeaturesPanel(GlassPanel):
     """Glassmorphic panel for Interactive Features (Weather Journal, Favorites, Alerts)"""
@@ -745,16 +892,13 @@ class InteractiveFeaturesPanel(GlassPanel):
                 btn.config(bg=self.theme.INPUT_BG, fg=self.theme.TEXT_COLOR)
         
         # Hide all frames
-        for frame in [self.journal_frame, self.favorites_frame, self.alerts_frame]:
+        frames = (self.journal_frame, self.favorites_frame, self.alerts_frame)
+        for frame in frames:
             frame.pack_forget()
         
         # Show selected frame
-        if tab_index == 0:
-            self.journal_frame.pack(fill='both', expand=True)
-        elif tab_index == 1:
-            self.favorites_frame.pack(fill='both', expand=True)
-        elif tab_index == 2:
-            self.alerts_frame.pack(fill='both', expand=True)
+        if 0 <= tab_index < len(frames):
+            frames[tab_index].pack(fill='both', expand=True)
         
         self.current_tab = tab_index
     
@@ -1136,12 +1280,9 @@ class SmartFeaturesPanel(GlassPanel):
             widget.pack_forget()
         
         # Show selected tab
-        if tab_index == 0:
-            self.prediction_frame.pack(fill='both', expand=True)
-        elif tab_index == 1:
-            self.trends_frame.pack(fill='both', expand=True)
-        elif tab_index == 2:
-            self.activity_frame.pack(fill='both', expand=True)
+        frames = (self.prediction_frame, self.trends_frame, self.activity_frame)
+        if 0 <= tab_index < len(frames):
+            frames[tab_index].pack(fill='both', expand=True)
         
         self.current_smart_tab = tab_index
     
@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union
 import tkinter as tk
 import io
+from collections import OrderedDict
 
 # Try to import PIL, but provide fallbacks if not available
 try:
@@ -128,10 +129,87 @@ class ThemeStyler:
         """
         Initialize with theme configuration
         
+        Style option dicts are built once here; the style_* methods only
+        look them up, so styling a widget allocates nothing.
+        
         Args:
             theme_config: Theme configuration object
         """
-        self.theme = theme_config
+        self.theme = theme = theme_config
+        
+        self._label_styles = {
+            "default": {
+                "fg": theme.TEXT_COLOR,
+                "bg": theme.CONTENT_BG,
+                "font": theme.BODY_FONT
+            },
+            "title": {
+                "fg": theme.TITLE_COLOR,
+                "bg": theme.CONTENT_BG,
+                "font": theme.TITLE_FONT
+            },
+            "subtitle": {
+                "fg": theme.SUBTITLE_COLOR,
+                "bg": theme.CONTENT_BG,
+                "font": theme.SUBTITLE_FONT
+            },
+            "muted": {
+                "fg": theme.MUTED_TEXT,
+                "bg": theme.CONTENT_BG,
+                "font": theme.BODY_FONT
+            }
+        }
+        
+        common_button_style = {
+            "relief": "flat",
+            "bd": 0,
+            "padx": 15,
+            "pady": 8,
+            "cursor": "hand2"
+        }
+        self._button_styles = {
+            "primary": {
+                "bg": theme.PRIMARY_ACCENT,
+                "fg": "#ffffff",
+                "activebackground": theme.HIGHLIGHT,
+                "font": theme.BUTTON_FONT,
+                **common_button_style
+            },
+            "secondary": {
+                "bg": theme.BUTTON_BG,
+                "fg": theme.TEXT_COLOR,
+                "activebackground": theme.BUTTON_HOVER_BG,
+                "font": theme.BUTTON_FONT,
+                **common_button_style
+            },
+            "danger": {
+                "bg": theme.DANGER_COLOR,
+                "fg": "#ffffff",
+                "activebackground": "#c82333",
+                "font": theme.BUTTON_FONT,
+                **common_button_style
+            }
+        }
+        
+        self._frame_styles = {
+            "default": {
+                "bg": theme.CONTENT_BG,
+                "relief": "flat",
+                "bd": 0
+            },
+            "glass": {
+                "bg": theme.GLASS_BG,
+                "relief": "raised",
+                "bd": theme.BORDER_WIDTH,
+                "highlightbackground": theme.BORDER,
+                "highlightthickness": 1
+            },
+            "container": {
+                "bg": theme.CONTAINER_BG,
+                "relief": "flat",
+                "bd": 0
+            }
+        }
     
     def style_label(self, label: tk.Label, style_type: str = "default") -> tk.Label:
         """
@@ -144,31 +222,8 @@ class ThemeStyler:
         Returns:
             Styled label widget
         """
-        styles = {
-            "default": {
-                "fg": self.theme.TEXT_COLOR,
-                "bg": self.theme.CONTENT_BG,
-                "font": self.theme.BODY_FONT
-            },
-            "title": {
-                "fg": self.theme.TITLE_COLOR,
-                "bg": self.theme.CONTENT_BG,
-                "font": self.theme.TITLE_FONT
-            },
-            "subtitle": {
-                "fg": self.theme.SUBTITLE_COLOR,
-                "bg": self.theme.CONTENT_BG,
-                "font": self.theme.SUBTITLE_FONT
-            },
-            "muted": {
-                "fg": self.theme.MUTED_TEXT,
-                "bg": self.theme.CONTENT_BG,
-                "font": self.theme.BODY_FONT
-            }
-        }
-        
-        style = styles.get(style_type, styles["default"])
-        label.configure(**style)
+        styles = self._label_styles
+        label.configure(**styles.get(style_type, styles["default"]))
         return label
     
     def style_button(self, button: tk.Button, style_type: str = "primary") -> tk.Button:
@@ -182,37 +237,8 @@ class ThemeStyler:
         Returns:
             Styled button widget
         """
-        styles = {
-            "primary": {
-                "bg": self.theme.PRIMARY_ACCENT,
-                "fg": "#ffffff",
-                "activebackground": self.theme.HIGHLIGHT,
-                "font": self.theme.BUTTON_FONT
-            },
-            "secondary": {
-                "bg": self.theme.BUTTON_BG,
-                "fg": self.theme.TEXT_COLOR,
-                "activebackground": self.theme.BUTTON_HOVER_BG,
-                "font": self.theme.BUTTON_FONT
-            },
-            "danger": {
-                "bg": self.theme.DANGER_COLOR,
-                "fg": "#ffffff",
-                "activebackground": "#c82333",
-                "font": self.theme.BUTTON_FONT
-            }
-        }
-        
-        style = styles.get(style_type, styles["primary"])
-        common_style = {
-            "relief": "flat",
-            "bd": 0,
-            "padx": 15,
-            "pady": 8,
-            "cursor": "hand2"
-        }
-        
-        button.configure(**style, **common_style)
+        styles = self._button_styles
+        button.configure(**styles.get(style_type, styles["primary"]))
         return button
     
     def style_frame(self, frame: tk.Frame, style_type: str = "default") -> tk.Frame:
@@ -226,43 +252,44 @@ class ThemeStyler:
         Returns:
             Styled frame widget
         """
-        styles = {
-            "default": {
-                "bg": self.theme.CONTENT_BG,
-                "relief": "flat",
-                "bd": 0
-            },
-            "glass": {
-                "bg": self.theme.GLASS_BG,
-                "relief": "raised",
-                "bd": self.theme.BORDER_WIDTH,
-                "highlightbackground": self.theme.BORDER,
-                "highlightthickness": 1
-            },
-            "container": {
-                "bg": self.theme.CONTAINER_BG,
-                "relief": "flat",
-                "bd": 0
-            }
-        }
-        
-        style = styles.get(style_type, styles["default"])
-        frame.configure(**style)
+        styles = self._frame_styles
+        frame.configure(**styles.get(style_type, styles["default"]))
         return frame
 
 class ImageCache:
     """Utility class for caching and loading images locally"""
     
-    def __init__(self, cache_dir: str = "cache"):
+    def __init__(self, cache_dir: str = "cache", max_images: Optional[int] = None):
         """
         Initialize image cache
         
+        The in-memory cache holds the reference that keeps each PhotoImage
+        alive in Tk. With ``max_images`` set, evicted images are released, so
+        callers displaying them must keep their own reference (e.g. on the
+        widget) or the image will go blank.
+        
         Args:
             cache_dir: Directory to store cached images
+            max_images: Most PhotoImages kept in memory, least recently used
+                dropped first; None (default) keeps every image
         """
         self.cache_dir = cache_dir
         os.makedirs(cache_dir, exist_ok=True)
-        self.loaded_images = {}  # In-memory cache
+        self.max_images = max_images
+        self.loaded_images = OrderedDict()  # In-memory LRU cache
+    
+    def _cached_image(self, cache_key: str) -> Optional[Any]:
+        """Return an in-memory PhotoImage and mark it recently used"""
+        photo_image = self.loaded_images.get(cache_key)
+        if photo_image is not None:
+            self.loaded_images.move_to_end(cache_key)
+        return photo_image
+    
+    def _remember_image(self, cache_key: str, photo_image: Any) -> None:
+        """Keep a PhotoImage referenced, evicting the least recently used if bounded"""
+        self.loaded_images[cache_key] = photo_image
+        if self.max_images is not None and len(self.loaded_images) > self.max_images:
+            self.loaded_images.popitem(last=False)
     
     def get_image_from_url(self, url: str, size: tuple = (64, 64)) -> Optional[Any]:
         """
@@ -278,15 +305,16 @@ class ImageCache:
         if not url or not PIL_AVAILABLE:
             return None
         
+        # Check in-memory cache first, before hashing the URL
+        cache_key = f"{url}_{size[0]}x{size[1]}"
+        photo_image = self._cached_image(cache_key)
+        if photo_image is not None:
+            return photo_image
+        
         # Create cache filename
         filename = self._url_to_filename(url)
         cache_path = os.path.join(self.cache_dir, filename)
         
-        # Check in-memory cache first
-        cache_key = f"{url}_{size[0]}x{size[1]}"
-        if cache_key in self.loaded_images:
-            return self.loaded_images[cache_key]
-        
         try:
             # Try to load from disk cache
             if os.path.exists(cache_path):
@@ -308,7 +336,7 @@ class ImageCache:
             photo_image = ImageTk.PhotoImage(image)
             
             # Cache in memory
-            self.loaded_images[cache_key] = photo_image
+            self._remember_image(cache_key, photo_image)
             
             return photo_image
             
@@ -332,8 +360,9 @@ class ImageCache:
             
         cache_key = f"placeholder_{size[0]}x{size[1]}_{color}"
         
-        if cache_key in self.loaded_images:
-            return self.loaded_images[cache_key]
+        photo_image = self._cached_image(cache_key)
+        if photo_image is not None:
+            return photo_image
         
         try:
             # Create placeholder image
@@ -341,7 +370,7 @@ class ImageCache:
             photo_image = ImageTk.PhotoImage(image)
             
             # Cache in memory
-            self.loaded_images[cache_key] = photo_image
+            self._remember_image(cache_key, photo_image)
             
             return photo_image
             